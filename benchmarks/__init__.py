@@ -0,0 +1,13 @@
+"""
+Benchmarks of the calendar and astronomy hot paths
+
+Run from the repository root:
+
+    $ PYTHONPATH=src python -m benchmarks --save baseline.json
+    $ PYTHONPATH=src python -m benchmarks --compare baseline.json
+
+Each scenario reports calls per second (best of several repeats), the peak
+memory allocated by a single call and the memory blocks it leaves allocated
+(by tracemalloc). --compare fails when a scenario is slower than the baseline
+by more than the tolerance.
+"""
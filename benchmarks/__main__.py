@@ -0,0 +1,46 @@
+import argparse
+import sys
+
+from . import runner
+from .scenarios import SCENARIOS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmarks of the calendar and astronomy hot paths",
+    )
+    parser.add_argument("names", nargs="*", help="scenarios to run, default: all")
+    parser.add_argument("--list", action="store_true", help="list the scenarios")
+    parser.add_argument("--repeat", type=int, default=runner.REPEAT)
+    parser.add_argument("--save", metavar="PATH", help="save the results as baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare to a baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed slow down relative to the baseline (default: 0.2)",
+    )
+    args = parser.parse_args(argv)
+    if args.list:
+        print("\n".join(SCENARIOS))
+        return 0
+    unknown = [name for name in args.names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+
+    baseline = runner.load(args.compare) if args.compare else None
+    results = runner.run(args.names or None, args.repeat)
+    print(runner.format_table(results, baseline))
+    if args.save:
+        runner.save(results, args.save)
+    if baseline:
+        slower = runner.compare(results, baseline, args.tolerance)
+        for name, ratio in slower.items():
+            print(f"slower than baseline: {name} ({ratio:.2f}x)", file=sys.stderr)
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
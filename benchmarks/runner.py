@@ -0,0 +1,122 @@
+"""
+Run the benchmark scenarios, save and compare results
+"""
+
+import json
+import platform
+import timeit
+import tracemalloc
+import typing
+
+from .scenarios import SCENARIOS
+
+REPEAT = 5
+MIN_TIME = 0.2  # seconds of a single repeat
+
+
+class Result(typing.NamedTuple):
+    calls_per_second: float
+    peak_bytes: int  # peak memory allocated by a call
+    retained_blocks: int  # memory blocks still allocated after a call
+
+
+def measure_allocations(function: typing.Callable[[], None]):
+    """
+    Measure the peak memory and the retained blocks of a single call
+    """
+    function()  # warm up caches and lazy imports
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        current, _ = tracemalloc.get_traced_memory()
+        if hasattr(tracemalloc, "reset_peak"):  # python 3.9
+            tracemalloc.reset_peak()
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    # ignore the memory of tracemalloc and of this measurement
+    ignore = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    )
+    stats = after.filter_traces(ignore).compare_to(
+        before.filter_traces(ignore), "lineno"
+    )
+    retained = sum(stat.count_diff for stat in stats)
+    return peak - current, retained
+
+
+def run_scenario(function: typing.Callable[[], None], repeat: int = REPEAT):
+    timer = timeit.Timer(function)
+    number, elapsed = timer.autorange()
+    number = max(number, int(number * MIN_TIME / max(elapsed, 1e-9)))
+    best = min(timer.repeat(repeat=repeat, number=number))
+    peak_bytes, retained_blocks = measure_allocations(function)
+    return Result(number / best, peak_bytes, retained_blocks)
+
+
+def run(names: typing.Optional[typing.Iterable[str]] = None, repeat: int = REPEAT):
+    """
+    Run scenarios (all by default), returns {name: Result}
+    """
+    names = list(SCENARIOS) if names is None else list(names)
+    return {name: run_scenario(SCENARIOS[name], repeat) for name in names}
+
+
+def save(results: typing.Dict[str, Result], path: str):
+    data = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "scenarios": {name: result._asdict() for name, result in results.items()},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def load(path: str):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {name: Result(**values) for name, values in data["scenarios"].items()}
+
+
+def compare(
+    results: typing.Dict[str, Result],
+    baseline: typing.Dict[str, Result],
+    tolerance: float,
+):
+    """
+    Find the scenarios slower than the baseline by more than tolerance
+
+    returns : {name: speed ratio to the baseline}
+    """
+    slower = {}
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result.calls_per_second / baseline[name].calls_per_second
+        if ratio < 1 - tolerance:
+            slower[name] = ratio
+    return slower
+
+
+def format_table(
+    results: typing.Dict[str, Result],
+    baseline: typing.Optional[typing.Dict[str, Result]] = None,
+):
+    width = max(len(name) for name in results)
+    lines = [
+        f"{'scenario':<{width}} {'calls/s':>12} {'peak bytes':>11} {'retained':>9}"
+        + (f" {'vs baseline':>12}" if baseline else "")
+    ]
+    for name, result in results.items():
+        line = (
+            f"{name:<{width}} {result.calls_per_second:>12,.0f}"
+            f" {result.peak_bytes:>11,} {result.retained_blocks:>9,}"
+        )
+        if baseline and name in baseline:
+            ratio = result.calls_per_second / baseline[name].calls_per_second
+            line += f" {ratio:>11.2f}x"
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,81 @@
+"""
+Benchmark scenarios, each is a function without arguments doing one call
+
+HDate caches its absolute day, so the scenarios create their dates on each call
+to measure the computation of the day too.
+"""
+
+import datetime
+
+from hdate import molad
+from hdate.hdate import HDate
+from hdate.molad import Months
+from hdate.moon import Moon
+from hdate.sun import Sun
+from hdate.view_arc import ViewArc
+
+DATE = (15, 7, 5784)
+OTHER_DATE = (3, 11, 4938)
+GREGORIAN_DATE = datetime.date(2024, 4, 23)
+YEARS = range(5000, 5100)
+
+
+def hdate_numbers():
+    HDate(15, 7, 5784)
+
+
+def hdate_strings():
+    HDate("טו", "ניסן", "ה-תשפד")
+
+
+def days_diff():
+    Months.days_diff(HDate(*OTHER_DATE), HDate(*DATE))
+
+
+def date_add_days():
+    Months.date_add_days(HDate(*OTHER_DATE), 300000)
+
+
+def from_georgian():
+    molad.from_georgian(GREGORIAN_DATE)
+
+
+def to_georgian():
+    molad.to_georgian(HDate(*DATE))
+
+
+def year_pattern_range():
+    for year in YEARS:
+        Months.year_pattern(year)
+
+
+def year_pattern_range_uncached():
+    Months.year_info_cache_clear()
+    year_pattern_range()
+
+
+def sun_location():
+    Sun.location(HDate(*DATE))
+
+
+def moon_true_location():
+    Moon.true_location(HDate(*DATE))
+
+
+def view_arc():
+    ViewArc.compute(HDate(*DATE))
+
+
+SCENARIOS = {
+    "HDate(numbers)": hdate_numbers,
+    "HDate(strings)": hdate_strings,
+    "Months.days_diff": days_diff,
+    "Months.date_add_days": date_add_days,
+    "from_georgian": from_georgian,
+    "to_georgian": to_georgian,
+    f"Months.year_pattern x{len(YEARS)}": year_pattern_range,
+    f"Months.year_pattern x{len(YEARS)} uncached": year_pattern_range_uncached,
+    "Sun.location": sun_location,
+    "Moon.true_location": moon_true_location,
+    "ViewArc.compute": view_arc,
+}
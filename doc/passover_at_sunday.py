@@ -1,16 +1,13 @@
 from collections import Counter
 import matplotlib.pyplot as plt
-from hdate import hdate
 from hdate import molad
+from hdate import query
 import numpy as np
 
 begin, end = 5000, 5999
-weekdays = []
-for year in range(begin, end):
-    the_day = hdate.HDate(15, "ניסן", year)
-    weekdays.append(molad.Months.weekday(the_day))
+weekdays = [molad.Months.year_info(year).passover_weekday for year in range(begin, end)]
 
-yearlen = [molad.Months.year_days(year) for year in range(begin, end)]
+yearlen = molad.Months.year_table(begin, end).days
 
 # First histogram: count occurrences of weekdays
 weekday_counts = Counter(weekdays)
@@ -19,7 +16,7 @@ weekdays_names = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
 weekday_values = [weekday_counts.get(i, 0) for i in labels]
 
 # Second histogram: count differences
-diffs = np.diff(np.where(np.array(weekdays) == 1)).squeeze()
+diffs = np.diff(query.find_years(query.weekday_is("ניסן", 15, 1), begin, end))
 diff_counts = Counter(diffs)
 diff_labels = sorted(diff_counts.keys())
 diff_values = [diff_counts[i] for i in diff_labels]
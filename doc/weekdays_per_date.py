@@ -1,64 +1,30 @@
-from hdate.molad import (
-    Months,
-    YEARS_PATTERNS_LEAP,
-    YEARS_PATTERNS_NON_LEAP,
-)
-from hdate.gematria import MONTHS_LEAP, str_to_num, num_to_str
+from hdate.molad import Months
+from hdate.gematria import MONTHS_LEAP, MONTHS_NO_LEAP, num_to_str
 
-import copy
 import matplotlib.pyplot as plt
 from matplotlib.ticker import MaxNLocator
 
-
-month_days = [30, 29, 29, 29, 30, 29, 0, 0, 30, 29, 30, 29, 30, 29]
-
-# prepare the dictionary
-dates = {}
-for month in range(14):
-    for day in range(30):
-        dates.setdefault((month, day), set())
-
-
-def update_dates(dates, months, current_day):
-    for month, days in enumerate(months):
-        for day in range(days):
-            val = dates.setdefault((month, day), set())
-            val.add(current_day % 7)
-            current_day = current_day + 1
-
-
-for pattern in YEARS_PATTERNS_NON_LEAP:
-    specific_month_days = copy.copy(month_days)
-    if pattern[1] == "ש":
-        specific_month_days[1] += 1
-        specific_month_days[2] += 1
-    elif pattern[1] == "כ":
-        specific_month_days[2] += 1
-
-    update_dates(dates, specific_month_days, str_to_num(pattern[0]))
-month_days = [30, 29, 29, 29, 30, 0, 29, 30, 30, 29, 30, 29, 30, 29]
-for pattern in YEARS_PATTERNS_LEAP:
-    specific_month_days = copy.copy(month_days)
-    if pattern[1] == "ש":
-        specific_month_days[1] += 1
-        specific_month_days[2] += 1
-    elif pattern[1] == "כ":
-        specific_month_days[2] += 1
-    update_dates(dates, specific_month_days, str_to_num(pattern[0]))
-
-# remove empty
-dates = {k: v for k, v in dates.items() if v}
-
-months_names = copy.copy(MONTHS_LEAP)
-months_names.insert(5, "אדר")
-months_names[6] = "אדר א'"
+# months of both leap and non leap years, in order
+# אדר א' has 30 days and אדר ב' has 29 (פרק ח הלכה ה). The tables of
+# Months.possible_weekdays follow it, earlier versions of this graph swapped them
+months_names = MONTHS_NO_LEAP[:6] + MONTHS_LEAP[5:7] + MONTHS_NO_LEAP[6:]
 
 # Convert to readable
 pattern_per_date = {}
-for k, v in dates.items():
-    pattern = "".join([num_to_str(vv if vv != 0 else 7) for vv in v][::-1])
-    date = f"{num_to_str(k[1]+1)[::-1]} {months_names[k[0]]}"[::-1]
-    pattern_per_date[date] = pattern
+for month in months_names:
+    for day in range(1, 31):
+        weekdays = set()
+        for is_leap in (False, True):
+            if month in MONTHS_LEAP[5:7] and not is_leap:
+                continue
+            if month == MONTHS_NO_LEAP[5] and is_leap:
+                continue
+            weekdays.update(Months.possible_weekdays(month, day, is_leap))
+        if not weekdays:
+            continue
+        pattern = "".join([num_to_str(v) for v in sorted(weekdays)])
+        date = f"{num_to_str(day)[::-1]} {month}"[::-1]
+        pattern_per_date[date] = pattern
 
 
 # Graph
@@ -1,6 +1,6 @@
 # scripts/pattern_hist_leap_split.py
 """
-Compute histogram of Hebrew year patterns (4000–6000) using Months.year_pattern(),
+Compute histogram of Hebrew year patterns (4000–6000) using Months.year_table(),
 split into leap/non-leap groups, sort each group by frequency, and plot with percentages.
 
 Notes:
@@ -12,12 +12,12 @@ from collections import Counter
 from typing import Dict, List, Tuple
 
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.ticker import PercentFormatter
 from matplotlib.patches import Patch
 
 # Import your project modules (adjust if your package path differs)
-from hdate.molad import Months
-from hdate.leap_years import leapYear
+from hdate.molad import Months, YEARS_PATTERNS_CODES, YEARS_PATTERNS_LEAP
 
 
 def compute_counts(start: int, end: int) -> Tuple[Counter, Counter, int]:
@@ -26,12 +26,14 @@ def compute_counts(start: int, end: int) -> Tuple[Counter, Counter, int]:
     nonleap_counts = Counter()
     total = end - start + 1
 
-    for y in range(start, end + 1):
-        pat = Months.year_pattern(y)[::-1]
-        if leapYear.is_leap(y):
-            leap_counts[pat] += 1
+    table = Months.year_table(start, end + 1)
+    codes, counts = np.unique(table.pattern, return_counts=True)
+    for code, count in zip(codes, counts):
+        pat = YEARS_PATTERNS_CODES[code]
+        if pat in YEARS_PATTERNS_LEAP:
+            leap_counts[pat[::-1]] += int(count)
         else:
-            nonleap_counts[pat] += 1
+            nonleap_counts[pat[::-1]] += int(count)
 
     return leap_counts, nonleap_counts, total
 
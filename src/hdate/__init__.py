@@ -0,0 +1,11 @@
+import os
+
+if os.environ.get("HDATE_INSTRUMENT", "0") not in ("", "0"):
+    from . import instrumentation
+
+    instrumentation.enable_from_environment()
+
+if os.environ.get("HDATE_YEAR_CACHE"):
+    from . import year_cache
+
+    year_cache.use_year_cache_from_environment()
@@ -0,0 +1,282 @@
+"""
+Command line batch converter of dates
+
+Reads gregorian or hebrew dates, one per line, as CSV (the first column) or as
+JSON lines (a string, or an object with a "date" field), and writes for each
+date its gregorian and hebrew dates, weekday, year pattern and the molad of
+its month. The dates are read, converted with numpy and written in batches,
+optionally by several worker processes.
+
+Hebrew dates are written as year-month-day, with the month number of the year
+(see gematria.month_to_num). They may be read in this form, or as day, month
+and year separated by spaces (e.g. "כו אדר ה'תשפג").
+
+Example:
+    >>> import io
+    >>> output = io.StringIO()
+    >>> convert(io.StringIO("2023-03-19\\n2023-09-16\\n"), output)
+    >>> print(output.getvalue().replace("\\r", ""), end="")
+    date,gregorian,hebrew,weekday,pattern,molad_weekday,molad_hours,molad_parts
+    2023-03-19,2023-03-19,5783-06-26,1,בשה,2,18,731
+    2023-09-16,2023-09-16,5784-01-01,7,זחג,6,11,882
+"""
+
+import argparse
+import collections
+import csv
+import io
+import itertools
+import json
+import re
+import sys
+import typing
+from concurrent.futures import ProcessPoolExecutor
+
+from . import molad
+from .hdate import HDate
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+FIELDS = (
+    "date",
+    "gregorian",
+    "hebrew",
+    "weekday",
+    "pattern",
+    "molad_weekday",
+    "molad_hours",
+    "molad_parts",
+)
+CALENDARS = ("gregorian", "hebrew")
+FORMATS = ("csv", "jsonl")
+BATCH_SIZE = 10000
+BUFFER_SIZE = 1 << 20
+
+_NUMERIC_DATE = re.compile(r"^\s*(-?\d+)-(\d+)-(\d+)\s*$")
+
+
+def _parse_hebrew(value: str):
+    """
+    Parse a hebrew date to a packed date (see molad.pack_dates)
+    Raises ValueError for a month or a day which is not in its year
+
+    >>> _parse_hebrew("5783-06-26"), _parse_hebrew("כו אדר ה'תשפג")
+    (57830626, 57830626)
+    >>> _parse_hebrew("5783-13-01")
+    Traceback (most recent call last):
+    ...
+    ValueError: 5783-13-01 is not a hebrew date, 5783 has 12 months
+    """
+    match = _NUMERIC_DATE.match(value)
+    if match:
+        year, month, day = (int(group) for group in match.groups())
+    else:
+        parts = value.split()
+        if len(parts) != 3:
+            raise ValueError(f"{value} is not a hebrew date")
+        date = HDate(*parts)
+        year, month, day = date._year, date._month, date._month_day
+    months_length = molad.Months.months_length(year)
+    if not 1 <= month <= len(months_length):
+        raise ValueError(
+            f"{value} is not a hebrew date, {year} has {len(months_length)} months"
+        )
+    if not 1 <= day <= months_length[month - 1]:
+        raise ValueError(
+            f"{value} is not a hebrew date,"
+            f" month {month} of {year} has {months_length[month - 1]} days"
+        )
+    return molad.pack_dates(year, month, day)
+
+
+def _read_values(lines: typing.Iterable[str], input_format: str, skip_header=False):
+    """
+    Generate the date strings of the input lines
+    """
+    if input_format == "csv":
+        rows = csv.reader(lines)
+        if skip_header:
+            next(rows, None)
+        for row in rows:
+            if row and row[0].strip():
+                yield row[0].strip()
+    else:
+        for line in lines:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield record["date"] if isinstance(record, dict) else str(record)
+
+
+def convert_batch(values: typing.List[str], calendar: str = "gregorian"):
+    """
+    Convert a batch of dates of a calendar, returns a row (by FIELDS) per date
+
+    >>> convert_batch(["5783-06-26"], "hebrew")
+    [('5783-06-26', '2023-03-19', '5783-06-26', 1, 'בשה', 2, 18, 731)]
+    """
+    if not values:
+        return []
+    if calendar == "gregorian":
+        gregorian = np.array(values, dtype="datetime64[D]")
+        packed = molad.from_georgian_array(gregorian)
+    else:
+        packed = np.array([_parse_hebrew(value) for value in values], dtype=np.int64)
+        gregorian = molad.to_georgian_array(packed)
+
+    # the first day (0) is Monday
+    weekday = (molad.Months.absolute_day_array(packed) + 1) % 7 + 1
+    year, month, day = molad.unpack_dates(packed)
+    first_year = int(year.min())
+    table = molad.Months.year_table(first_year, int(year.max()) + 1)
+    patterns = np.array(molad.YEARS_PATTERNS_CODES)[table.pattern[year - first_year]]
+    molad_weekday, molad_hours, molad_parts = molad.Months.molad_day_array(packed)
+
+    hebrew = [
+        f"{y}-{m:02}-{d:02}"
+        for y, m, d in zip(year.tolist(), month.tolist(), day.tolist())
+    ]
+    return list(
+        zip(
+            values,
+            gregorian.astype(str).tolist(),
+            hebrew,
+            weekday.tolist(),
+            patterns.tolist(),
+            molad_weekday.tolist(),
+            molad_hours.tolist(),
+            molad_parts.tolist(),
+        )
+    )
+
+
+def format_rows(rows, output_format: str):
+    """
+    Format converted rows as CSV (without a header) or JSON lines
+    """
+    if output_format == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue()
+    return "".join(
+        json.dumps(dict(zip(FIELDS, row)), ensure_ascii=False) + "\n" for row in rows
+    )
+
+
+def _process_batch(job):
+    values, calendar, output_format = job
+    return format_rows(convert_batch(values, calendar), output_format)
+
+
+def _map_ordered(function, jobs, workers: int):
+    """
+    Map jobs by worker processes, keeping the order and at most 2 jobs per
+    worker in flight, so that the input is streamed
+    """
+    if workers <= 1:
+        yield from map(function, jobs)
+        return
+    with ProcessPoolExecutor(workers) as executor:
+        pending = collections.deque()
+        for job in jobs:
+            pending.append(executor.submit(function, job))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def convert(
+    lines: typing.Iterable[str],
+    output: typing.TextIO,
+    calendar: str = "gregorian",
+    input_format: str = "csv",
+    output_format: typing.Optional[str] = None,
+    batch_size: int = BATCH_SIZE,
+    workers: int = 1,
+    skip_header: bool = False,
+):
+    """
+    Convert the dates of input lines and write them to output, see module doc
+    """
+    output_format = output_format or input_format
+    values = _read_values(lines, input_format, skip_header)
+    jobs = iter(
+        lambda: (list(itertools.islice(values, batch_size)), calendar, output_format),
+        ([], calendar, output_format),
+    )
+    if output_format == "csv":
+        output.write(format_rows([FIELDS], output_format))
+    for text in _map_ordered(_process_batch, jobs, workers):
+        output.write(text)
+
+
+def _open(file: typing.Union[str, typing.TextIO], mode: str):
+    """
+    Open a path, or reopen a standard stream, with a BUFFER_SIZE buffer.
+    A stream without a file descriptor (e.g. io.StringIO) is used as is
+    """
+    if not isinstance(file, str):
+        try:
+            file.flush()
+            file = file.fileno()
+        except (AttributeError, OSError):
+            return file
+    return open(
+        file,
+        mode,
+        encoding="utf-8",
+        buffering=BUFFER_SIZE,
+        newline="",
+        closefd=isinstance(file, str),
+    )
+
+
+def main(argv: typing.Optional[typing.List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="hdate",
+        description="Convert gregorian or hebrew dates, one per line",
+    )
+    parser.add_argument("input", nargs="?", default="-", help="input file, - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="output file, - for stdout")
+    parser.add_argument("--calendar", choices=CALENDARS, default="gregorian")
+    parser.add_argument("--input-format", choices=FORMATS, default="csv")
+    parser.add_argument(
+        "--output-format", choices=FORMATS, help="default: the input format"
+    )
+    parser.add_argument("--skip-header", action="store_true", help="of CSV input")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=1, help="worker processes")
+    args = parser.parse_args(argv)
+    if args.batch_size < 1 or args.workers < 1:
+        parser.error("--batch-size and --workers must be positive")
+
+    input_file = _open(sys.stdin if args.input == "-" else args.input, "r")
+    output_file = _open(sys.stdout if args.output == "-" else args.output, "w")
+    try:
+        convert(
+            input_file,
+            output_file,
+            args.calendar,
+            args.input_format,
+            args.output_format,
+            args.batch_size,
+            args.workers,
+            args.skip_header,
+        )
+    except (ValueError, KeyError) as e:
+        parser.exit(1, f"hdate: error: {e}\n")
+    finally:
+        # closing a reopened standard stream keeps its file descriptor open
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
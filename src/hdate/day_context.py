@@ -0,0 +1,85 @@
+"""
+A date prepared for the astronomy computations
+"""
+
+import functools
+import typing
+
+from .angle import angle
+from .hdate import HDate
+
+
+class DayContext(object):
+    """
+    A date with its days count from the beginning, computed once and shared by
+    all the astronomy computations of the date (Sun, Moon, ViewArc...)
+    The results of the memoized computations are kept in the context, so each
+    one is computed once per evaluation (see memoize)
+
+    >>> context = DayContext(HDate(4, "ניסן", "ד-תתקלח"))
+    >>> context.days_since(HDate(3, "ניסן", "ד-תתקלח"))
+    1
+    """
+
+    __slots__ = ("date", "absolute_day", "results")
+
+    def __init__(self, date: HDate):
+        self.date = date
+        self.absolute_day = date.absolute_day
+        self.results = {}
+
+    @staticmethod
+    def of(date: typing.Union[HDate, "DayContext"]):
+        """
+        The context of a date, or the context itself
+        """
+        if isinstance(date, DayContext):
+            return date
+        return DayContext(date)
+
+    def days_since(self, t0: HDate):
+        """
+        Days from t0 to the date, as Months.days_diff(t0, date)
+        """
+        return self.absolute_day - t0.absolute_day
+
+    def __repr__(self):
+        return f"DayContext({self.date!r})"
+
+
+def _copy(result):
+    # angles are mutable (remove_circles, round_to_parts...)
+    if isinstance(result, angle):
+        return result.copy()
+    if isinstance(result, tuple):
+        return tuple(_copy(item) for item in result)
+    return result
+
+
+def memoize(function):
+    """
+    Compute a function of a date once per DayContext, and return copies of the
+    result. Calls with more arguments are not memoized.
+
+    >>> calls = []
+    >>> @memoize
+    ... def days(date):
+    ...     calls.append(date)
+    ...     return date.absolute_day
+    >>> context = DayContext(HDate(1, 1, 2))
+    >>> days(context), days(context), len(calls)
+    (355, 355, 1)
+    """
+    key = function.__qualname__
+
+    @functools.wraps(function)
+    def wrapper(date, *args, **kwargs):
+        date = DayContext.of(date)
+        if args or kwargs:
+            return function(date, *args, **kwargs)
+        result = date.results.get(key)
+        if result is None:
+            result = date.results[key] = function(date)
+        return _copy(result)
+
+    return wrapper
@@ -1,9 +1,18 @@
+from fractions import Fraction
+
 from . import gematria
 
 
 class duration(object):
     """
     Class that represent a duration with integer parts
+    Stored as a single integer count of moments (רגעים)
+
+    The parts are always normalized from the total: all have the sign of the
+    duration. Setting a part or trimming the weeks keeps the value of the
+    duration and normalizes it, so duration(-1, -2).trim_weeks() (6 days less
+    2 hours) is duration(5, 22, 0). Multiplying by a float is rounded to the
+    nearest moment.
 
     >>> sinodal_month * 12
     duration(354, 8, 876)
@@ -11,48 +20,68 @@ class duration(object):
     duration(383, 21, 589)
     """
 
+    __slots__ = ("_moments_total",)
+
     PARTS_PER_HOUR = 1080  # פרק ו הלכה ב
     HOURS_PER_DAY = 24  # פרק ו הלכה ב
     MOMENTS_PER_PART = 76  # פרק י הלכה א
+    MOMENTS_PER_DAY = HOURS_PER_DAY * PARTS_PER_HOUR * MOMENTS_PER_PART
 
     def __init__(self, days=0, hours=0, parts=0, moments=0):
-        self._days = gematria.str_to_num(days)
-        self._hours = gematria.str_to_num(hours)
-        self._parts = gematria.str_to_num(parts)  # חלקים
-        self._moments = gematria.str_to_num(moments)  # רגעים
-
-        self.__normalize()
+        if type(days) == str:
+            days = gematria.str_to_num(days)
+        if type(hours) == str:
+            hours = gematria.str_to_num(hours)
+        if type(parts) == str:
+            parts = gematria.str_to_num(parts)  # חלקים
+        if type(moments) == str:
+            moments = gematria.str_to_num(moments)  # רגעים
+
+        moments_total = (
+            (days * self.HOURS_PER_DAY + hours) * self.PARTS_PER_HOUR + parts
+        ) * self.MOMENTS_PER_PART + moments
+        if type(moments_total) != int:
+            moments_total = round(moments_total)
+        self._moments_total = moments_total
+
+    @classmethod
+    def _from_moments(cls, moments_total: int):
+        """
+        Create a duration from moments count, without any conversion
+        """
+        res = cls.__new__(cls)
+        res._moments_total = moments_total
+        return res
 
     def __str__(self):
-        if self._moments:
-            return f"{self._days} ימים {self._hours} שעות {self._parts} חלקים {self._moments} רגעים"
+        days, hours, parts, moments = self._components()
+        if moments:
+            return f"{days} ימים {hours} שעות {parts} חלקים {moments} רגעים"
         else:
-            return f"{self._days} ימים {self._parts} שעות ו-{self._hours} חלקים"
+            return f"{days} ימים {parts} שעות ו-{hours} חלקים"
 
     def __repr__(self):
-        if self._moments:
-            return (
-                f"duration({self._days}, {self._hours}, {self._parts}, {self._moments})"
-            )
+        days, hours, parts, moments = self._components()
+        if moments:
+            return f"duration({days}, {hours}, {parts}, {moments})"
         else:
-            return f"duration({self._days}, {self._hours}, {self._parts})"
+            return f"duration({days}, {hours}, {parts})"
 
-    def __normalize(self):
+    def _components(self):
         """
-        Convert to int within the correct range of each member
+        Split to days, hours, parts and moments, each within its correct range
+        Negative durations have all members negative
         """
-        moments = (
-            (self._days * self.HOURS_PER_DAY + self._hours) * self.PARTS_PER_HOUR
-            + self._parts
-        ) * self.MOMENTS_PER_PART + self._moments
-        self._parts = int(moments / self.MOMENTS_PER_PART)
-        self._moments = moments - self._parts * self.MOMENTS_PER_PART
-
-        self._hours = int(self._parts / self.PARTS_PER_HOUR)
-        self._parts = int(self._parts - self._hours * self.PARTS_PER_HOUR)
+        sign = -1 if self._moments_total < 0 else 1
+        parts, moments = divmod(abs(self._moments_total), self.MOMENTS_PER_PART)
+        hours, parts = divmod(parts, self.PARTS_PER_HOUR)
+        days, hours = divmod(hours, self.HOURS_PER_DAY)
+        return sign * days, sign * hours, sign * parts, sign * moments
 
-        self._days = int(self._hours / self.HOURS_PER_DAY)
-        self._hours = int(self._hours - self._days * self.HOURS_PER_DAY)
+    def _set_components(self, days, hours, parts, moments):
+        self._moments_total = (
+            (days * self.HOURS_PER_DAY + hours) * self.PARTS_PER_HOUR + parts
+        ) * self.MOMENTS_PER_PART + moments
 
     def trim_weeks(self):
         """
@@ -60,8 +89,11 @@ class duration(object):
 
         >>> duration(15,2).trim_weeks()
         duration(1, 2, 0)
+        >>> duration(-1,-2).trim_weeks()
+        duration(5, 22, 0)
         """
-        self._days = self._days % 7
+        days, hours, parts, moments = self._components()
+        self._set_components(days % 7, hours, parts, moments)
         return self
 
     def as_days_fraction(self):
@@ -71,128 +103,132 @@ class duration(object):
         >>> duration(15,12).as_days_fraction()
         15.5
         """
-        return (
-            self._days
-            + (
-                self._hours
-                + (self._parts + (self._moments / self.MOMENTS_PER_PART))
-                / self.PARTS_PER_HOUR
-            )
-            / self.HOURS_PER_DAY
-        )
+        return self._moments_total / self.MOMENTS_PER_DAY
+
+    def as_parts(self):
+        """
+        Get the duration in parts (חלקים) only, ignoring the moments
+
+        >>> duration(1,2,3).as_parts()
+        28083
+        """
+        days, hours, parts, _ = self._components()
+        return (days * self.HOURS_PER_DAY + hours) * self.PARTS_PER_HOUR + parts
+
+    def as_moments(self):
+        """
+        Get the duration in moments (רגעים) only
+
+        >>> duration(0,0,1,2).as_moments()
+        78
+        """
+        return self._moments_total
 
     @property
     def days(self):
-        return self._days
+        return self._components()[0]
 
     @days.setter
     def days(self, d):
+        """
+        Set the days, keeping the other parts. The result is normalized,
+        e.g. setting -2 days to duration(1, 2, 3) is duration(-1, -21, -1077)
+        """
         assert type(d) == int
-        self._days = d
+        _, hours, parts, moments = self._components()
+        self._set_components(d, hours, parts, moments)
 
     @property
     def hours(self):
-        return self._hours
+        return self._components()[1]
 
     @hours.setter
     def hours(self, h):
         assert type(h) == int
         assert h <= self.HOURS_PER_DAY
-        self._hours = h
+        days, _, parts, moments = self._components()
+        self._set_components(days, h, parts, moments)
 
     @property
     def parts(self):
-        return self._parts
+        return self._components()[2]
 
     @property
     def minutes(self):
-        return (
-            (self._parts + (self._moments / self.MOMENTS_PER_PART))
-            / self.PARTS_PER_HOUR
-            * 60
-        )
+        _, _, parts, moments = self._components()
+        return (parts + (moments / self.MOMENTS_PER_PART)) / self.PARTS_PER_HOUR * 60
 
     @parts.setter
     def parts(self, p):
         assert type(p) == int
         assert p <= self.PARTS_PER_HOUR
-        self._parts = p
+        days, hours, _, moments = self._components()
+        self._set_components(days, hours, p, moments)
 
     @property
     def moments(self):
-        return self._moments
+        return self._components()[3]
 
     def __add__(self, d):
         """
         >>> duration(1,2,3) + duration(7,1,2)
         duration(8, 3, 5)
         """
-        res = duration(
-            self._days + d._days,
-            self._hours + d._hours,
-            self._parts + d._parts,
-            self._moments + d._moments,
-        )
-        return res
+        return duration._from_moments(self._moments_total + d._moments_total)
 
     def __sub__(self, d):
         """
         >>> duration(37,4,3) - duration(7,1,2)
         duration(30, 3, 1)
         """
-        res = duration(
-            self._days - d._days,
-            self._hours - d._hours,
-            self._parts - d._parts,
-            self._moments - d._moments,
-        )
-        return res
+        return duration._from_moments(self._moments_total - d._moments_total)
 
     def __mul__(self, scalar):
         """
+        Multiply, rounded to the nearest moment
+
         >>> sinodal_month * 12
         duration(354, 8, 876)
+        >>> sinodal_month * (1 / 3)
+        duration(9, 20, 264, 25)
         """
-        res = duration(
-            self._days * scalar,
-            self._hours * scalar,
-            self._parts * scalar,
-            self._moments * scalar,
-        )
-        return res
+        moments_total = self._moments_total * scalar
+        if type(moments_total) != int:
+            moments_total = round(moments_total)
+        return duration._from_moments(moments_total)
 
     def __rmul__(self, scalar):
         """
         >>> 12 * sinodal_month
         duration(354, 8, 876)
         """
-        res = duration(self._days, self._hours, self._parts, self._moments) * scalar
-        return res
+        return self * scalar
 
     def __truediv__(self, scalar):
         """
+        Divide, rounded to the nearest moment
+
         >>> duration(100, 24, 2) / 2
         duration(50, 12, 1)
+        >>> days_in_sun_year_rav_ada / 4
+        duration(91, 7, 519, 31)
+        >>> sinodal_month * 10**12 / 10**12 == sinodal_month
+        True
         """
-        res = duration(
-            self._days / scalar,
-            self._hours / scalar,
-            self._parts / scalar,
-            self._moments / scalar,
-        )
-        return res
+        if type(scalar) == int:
+            moments_total, remainder = divmod(self._moments_total, scalar)
+            if 2 * abs(remainder) >= abs(scalar):
+                moments_total += 1
+        else:
+            moments_total = round(Fraction(self._moments_total) / Fraction(scalar))
+        return duration._from_moments(moments_total)
 
     def __eq__(self, other):
         """
         >>> duration(1,2,3,5) == duration(1,2,3,5)
         True
         """
-        return (
-            self._days == other._days
-            and self._hours == other._hours
-            and self._parts == other._parts
-            and self._moments == other._moments
-        )
+        return self._moments_total == other._moments_total
 
 
 sinodal_month = duration(29, 12, 793)  # פרק ו הלכה ד
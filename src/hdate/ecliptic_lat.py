@@ -1,19 +1,39 @@
 from . import gematria
 from .angle import angle
 from .hdate import HDate
-from . import molad
+from .day_context import DayContext, memoize
 from . import sun
 from . import moon
 
 import math
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class EclipticLatitude:
     """
     Calculations of Moon's ecliptic latitude. פרק יז
     """
 
+    # פרק טז הלכה יא
+    corrections = {
+        0: angle(0),
+        10: angle(0, "נב"),
+        20: angle(1, "מג"),
+        30: angle(2, "ל"),
+        40: angle(3, "יג"),
+        50: angle(3, "נ"),
+        60: angle(4, "כ"),
+        70: angle(4, "מב"),
+        80: angle(4, "נה"),
+        90: angle(5),
+    }
+
     @staticmethod
+    @memoize
     def compute(date: HDate):
         """
         חישוב רוחב הירח
@@ -24,18 +44,7 @@ class EclipticLatitude:
         location = moon.Moon.true_location(date).as_degrees_fraction()
         head = EclipticLatitude.compute_head_location(date).as_degrees_fraction()
         diff = location - head
-        corrections = {
-            0: angle(0),
-            10: angle(0, "נב"),
-            20: angle(1, "מג"),
-            30: angle(2, "ל"),
-            40: angle(3, "יג"),
-            50: angle(3, "נ"),
-            60: angle(4, "כ"),
-            70: angle(4, "מב"),
-            80: angle(4, "נה"),
-            90: angle(5),
-        }
+        corrections = EclipticLatitude.corrections
         diff = diff % 360  # positive
         is_south = diff > 180
         if diff > 270:
@@ -58,10 +67,59 @@ class EclipticLatitude:
         """
         if coefficients is None:
             coefficients = moon_plane_coefs
-        days_since_t0 = molad.Months.days_diff(coefficients["t0"], date)
+        days_since_t0 = DayContext.of(date).days_since(coefficients["t0"])
         location = coefficients["x0"] + coefficients["v"] * days_since_t0
         return (angle(360) - location).remove_circles()
 
+    @staticmethod
+    def compute_head_location_array(days, coefficients=None):
+        """
+        Vectorized compute_head_location over an array of days from the
+        beginning (1,1,1) (see HDate.absolute_day), in degrees
+        """
+        if coefficients is None:
+            coefficients = moon_plane_coefs
+        days_since_t0 = (
+            np.asarray(days, dtype=np.int64) - coefficients["t0"].absolute_day
+        )
+        x0 = coefficients["x0"].as_degrees_fraction()
+        v = coefficients["v"].as_degrees_fraction()
+        return -(x0 + v * days_since_t0) % angle.DEGREES
+
+    @staticmethod
+    def compute_array(days, moon_location=None):
+        """
+        Vectorized compute over an array of days from the beginning (1,1,1)
+        moon_location : Moon.true_location_array(days), when already computed
+
+        returns : is_south, latitude (in degrees) arrays
+
+        >>> date = HDate(2, "אייר", "ד-תתקלח")
+        >>> is_south, latitude = EclipticLatitude.compute_array([date.absolute_day])
+        >>> is_south.tolist(), latitude.round(6).tolist()
+        ([True], [3.883333])
+        """
+        days = np.asarray(days, dtype=np.int64)
+        if moon_location is None:
+            moon_location = moon.Moon.true_location_array(days)
+        diff = (
+            moon_location - EclipticLatitude.compute_head_location_array(days)
+        ) % 360
+        is_south = diff > 180
+        diff = np.where(diff > 270, 360 - diff, diff)
+        diff = np.where((diff > 180) & (diff <= 270), diff - 180, diff)
+        diff = np.where((diff > 90) & (diff <= 180), 180 - diff, diff)
+        corrections = [
+            EclipticLatitude.corrections[degree].as_degrees_fraction()
+            for degree in range(0, 100, 10)
+        ]
+        corrections = np.array(corrections + corrections[-1:])
+        index = (diff // 10).astype(np.int64)
+        low = corrections[index]
+        high = corrections[index + 1]
+        units = diff // 1 - index * 10
+        return is_south, low + (high - low) * (units / 10)
+
 
 RambamBeginningDay = HDate("ג", "ניסן", "ד-תתקלח")
 moon_plane_coefs = {
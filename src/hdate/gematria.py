@@ -50,6 +50,17 @@ MONTHS_LEAP_SHORT = _remove_list_vowels(MONTHS_LEAP)
 MONTHS_SHORT = {True: MONTHS_LEAP_SHORT, False: MONTHS_NO_LEAP_SHORT}
 MONTHS = {True: MONTHS_LEAP, False: MONTHS_NO_LEAP}
 
+# Month name to ordered month #, for each leap state. Contains the full names and
+# the shortened ones, other spellings are found after shortening
+MONTHS_NUMBERS = {
+    is_leap: {
+        name: num + 1
+        for months_list in (MONTHS_SHORT[is_leap], MONTHS[is_leap])
+        for num, name in enumerate(months_list)
+    }
+    for is_leap in (True, False)
+}
+
 # Days names
 DAYS = {chr(ord("א") + i): i + 1 for i in range(7)}
 DAYS["ש"] = 7
@@ -275,9 +286,19 @@ def num_to_month(is_leap_year: bool, month: int):
 def month_str_to_num(is_leap_year: bool, month: str):
     """
     Convert month string to ordered month #, according to leap year
+
+    >>> month_str_to_num(True, "אדר ב")
+    7
+    >>> month_str_to_num(False, "חשוון")
+    2
     """
-    months_list = MONTHS_SHORT[is_leap_year]
-    return months_list.index(_remove_vowels(month)) + 1
+    months_numbers = MONTHS_NUMBERS[is_leap_year]
+    month_num = months_numbers.get(month)
+    if month_num is None:
+        month_num = months_numbers.get(_remove_vowels(month))
+        if month_num is None:
+            raise ValueError(f"{month} is not a month name")
+    return month_num
 
 
 def month_to_num(is_leap_year: bool, month: typing.Union[int, str]):
@@ -2,17 +2,29 @@
 Class for hebrew date representation
 """
 
+import functools
+import operator
 import typing
 
 from .leap_years import leapYear
 from . import gematria
 
 
+@functools.total_ordering
 class HDate:
     """
-    A hebrew date
+    A hebrew date. Immutable, ordered by the days from the beginning
+
+    >>> HDate(30, 1, 5783) + 1
+    HDate(1, 2, 5783)
+    >>> HDate(1, 2, 5783) - HDate(1, 1, 5783)
+    30
+    >>> sorted([HDate(1, 2, 5783), HDate(1, 1, 5783)])
+    [HDate(1, 1, 5783), HDate(1, 2, 5783)]
     """
 
+    __slots__ = ("_month_day", "_month", "_year", "_is_leap", "_absolute_day")
+
     def __init__(
         self,
         month_day: typing.Union[int, str],
@@ -22,10 +34,43 @@ class HDate:
         """
         Init a hebrew date
         """
-        self._year = gematria.year_to_num(year)
-        self._is_leap = leapYear.is_leap(self._year)
-        self._month = gematria.month_to_num(self._is_leap, month)
-        self._month_day = gematria.str_to_num(month_day)
+        if type(year) == int and type(month) == int and type(month_day) == int:
+            # fast path, nothing to convert
+            is_leap = leapYear.IS_LEAP[(year - 1) % leapYear.CYCLE]
+        else:
+            year = gematria.year_to_num(year)
+            is_leap = leapYear.is_leap(year)
+            month = gematria.month_to_num(is_leap, month)
+            month_day = gematria.str_to_num(month_day)
+        set_slot = object.__setattr__
+        set_slot(self, "_year", year)
+        set_slot(self, "_is_leap", is_leap)
+        set_slot(self, "_month", month)
+        set_slot(self, "_month_day", month_day)
+        set_slot(self, "_absolute_day", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("HDate is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("HDate is immutable")
+
+    def __reduce__(self):
+        return HDate, (self._month_day, self._month, self._year)
+
+    @property
+    def absolute_day(self):
+        """
+        Days from the beginning (1,1,1), computed once per date
+
+        >>> HDate(26, 6, 5783).absolute_day
+        2112025
+        """
+        if self._absolute_day is None:
+            from . import molad
+
+            object.__setattr__(self, "_absolute_day", molad.Months.absolute_day(self))
+        return self._absolute_day
 
     def __str__(self):
         """
@@ -46,12 +91,56 @@ class HDate:
         """
         >>> HDate(1,2,3) == HDate(1,2,3)
         True
+        >>> HDate(1,2,3) == None
+        False
         """
+        if not isinstance(other, HDate):
+            return NotImplemented
         return (
             self._year == other._year
             and self._month == other._month
             and self._month_day == other._month_day
         )
 
+    def __lt__(self, other):
+        """
+        >>> HDate(30, 1, 5783) < HDate(1, 2, 5783)
+        True
+        """
+        if not isinstance(other, HDate):
+            return NotImplemented
+        return self.absolute_day < other.absolute_day
+
     def __hash__(self):
         return hash((self._year, self._month, self._month_day))
+
+    def __add__(self, days: int):
+        """
+        >>> HDate(1, 1, 5783) + 355
+        HDate(1, 1, 5784)
+        """
+        try:
+            days = operator.index(days)
+        except TypeError:
+            return NotImplemented
+        from . import molad
+
+        date = molad.Months._diff_to_date(self.absolute_day + days)
+        object.__setattr__(date, "_absolute_day", self.absolute_day + days)
+        return date
+
+    __radd__ = __add__
+
+    def __sub__(self, other: typing.Union[int, "HDate"]):
+        """
+        >>> HDate(1, 1, 5784) - 1
+        HDate(29, 12, 5783)
+        >>> HDate(1, 1, 5784) - HDate(1, 1, 5783)
+        355
+        """
+        if isinstance(other, HDate):
+            return self.absolute_day - other.absolute_day
+        try:
+            return self + (-operator.index(other))
+        except TypeError:
+            return NotImplemented
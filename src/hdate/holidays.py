@@ -0,0 +1,134 @@
+"""
+Holidays and fasts of a year
+
+The holidays depend only on the year pattern (see molad.YEARS_PATTERNS), so a
+template of dates and weekdays is computed once for each pattern, and the
+holidays of a year are found by its pattern.
+"""
+
+import typing
+
+from . import gematria
+from . import molad
+from .hdate import HDate
+
+ADAR = "אדר"  # אדר ב' in a leap year
+SATURDAY = 7
+
+# name, month, day, length in days in israel, length in days in diaspora
+HOLIDAYS = [
+    ("ראש השנה", "תשרי", 1, 2, 2),
+    ("יום כיפור", "תשרי", 10, 1, 1),
+    ("סוכות", "תשרי", 15, 1, 2),
+    ("הושענא רבה", "תשרי", 21, 1, 1),
+    ("שמיני עצרת", "תשרי", 22, 1, 1),
+    ("שמחת תורה", "תשרי", 23, 0, 1),
+    ("חנוכה", "כסלו", 25, 8, 8),
+    ('ט"ו בשבט', "שבט", 15, 1, 1),
+    ("פורים", ADAR, 14, 1, 1),
+    ("שושן פורים", ADAR, 15, 1, 1),
+    ("פסח", "ניסן", 15, 1, 2),
+    ("שביעי של פסח", "ניסן", 21, 1, 2),
+    ('ל"ג בעומר', "אייר", 18, 1, 1),
+    ("שבועות", "סיון", 6, 1, 2),
+]
+LEAP_HOLIDAYS = [
+    ("פורים קטן", "אדר א'", 14, 1, 1),
+]
+
+# name, month, day, days to move when on Saturday
+FASTS = [
+    ("צום גדליה", "תשרי", 3, 1),
+    ("עשרה בטבת", "טבת", 10, 0),
+    ("תענית אסתר", ADAR, 13, -2),
+    ("שבעה עשר בתמוז", "תמוז", 17, 1),
+    ("תשעה באב", "אב", 9, 1),
+]
+
+
+class Holiday(typing.NamedTuple):
+    """
+    A day of a holiday, fast or ראש חודש in a specific year
+    """
+
+    name: str
+    date: HDate
+    weekday: int  # Sunday is 1
+    day_of_year: int  # 1 based
+
+
+def _pattern_template(pattern: str, diaspora: bool):
+    """
+    Compute the holidays of a year pattern
+
+    returns : list of (name, month, day, weekday, day of year), sorted by date
+    """
+    is_leap = pattern in molad.YEARS_PATTERNS_LEAP
+    _, year_type, _ = molad.YEARS_PATTERNS_CODES_INFO[
+        molad.YEARS_PATTERNS_CODES.index(pattern)
+    ]
+    year_weekday = gematria.str_to_num(pattern[0])
+    months_begin = molad.MONTHS_BEGIN[is_leap, year_type]
+    months_length = [end - begin for begin, end in zip(months_begin, months_begin[1:])]
+
+    def month_num(month: str):
+        if month == ADAR and is_leap:
+            month = "אדר ב'"
+        return gematria.month_to_num(is_leap, month)
+
+    def entry(name: str, month: int, day: int):
+        day_of_year = months_begin[month - 1] + day
+        # days may overflow to the next months
+        while day > months_length[month - 1]:
+            day -= months_length[month - 1]
+            month += 1
+        weekday = (year_weekday + day_of_year - 2) % 7 + 1
+        return name, month, day, weekday, day_of_year
+
+    template = []
+    holidays = HOLIDAYS + (LEAP_HOLIDAYS if is_leap else [])
+    for name, month, day, israel_length, diaspora_length in holidays:
+        length = diaspora_length if diaspora else israel_length
+        for day_num in range(length):
+            template.append(entry(name, month_num(month), day + day_num))
+
+    for name, month, day, saturday_move in FASTS:
+        fast = entry(name, month_num(month), day)
+        if fast[3] == SATURDAY:
+            fast = entry(name, month_num(month), day + saturday_move)
+        template.append(fast)
+
+    # ראש חודש is the last day of a full month and the first day of the next one
+    for month in range(2, len(months_length) + 1):
+        name = "ראש חודש " + gematria.num_to_month(is_leap, month)
+        if months_length[month - 2] == 30:
+            template.append(entry(name, month - 1, 30))
+        template.append(entry(name, month, 1))
+
+    return sorted(template, key=lambda holiday: holiday[4])
+
+
+HOLIDAYS_TEMPLATES = {
+    (pattern, diaspora): _pattern_template(pattern, diaspora)
+    for pattern in molad.YEARS_PATTERNS_CODES
+    for diaspora in (False, True)
+}
+
+
+def year_holidays(year: typing.Union[int, str], diaspora: bool = False):
+    """
+    Get the holidays, fasts and ראש חודש days of a year
+
+    Examples:
+        >>> holidays = year_holidays(5782)
+        >>> holidays[0]
+        Holiday(name='ראש השנה', date=HDate(1, 1, 5782), weekday=3, day_of_year=1)
+        >>> [h for h in holidays if h.name == "תשעה באב"]
+        [Holiday(name='תשעה באב', date=HDate(10, 12, 5782), weekday=1, day_of_year=335)]
+    """
+    year = gematria.year_to_num(year)
+    template = HOLIDAYS_TEMPLATES[molad.Months.year_pattern(year), diaspora]
+    return [
+        Holiday(name, HDate(day, month, year), weekday, day_of_year)
+        for name, month, day, weekday, day_of_year in template
+    ]
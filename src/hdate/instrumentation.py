@@ -0,0 +1,228 @@
+"""
+Opt-in call counters and timings of the hot functions
+
+While enabled, the functions in INSTRUMENTED are replaced on their classes by
+wrappers that count the calls and their cumulative time (including the time
+of the instrumented functions they call). When disabled the original functions
+are restored, so there is no cost at all.
+
+The calls of Months._year_info include the hits of its cache, the molad is
+recomputed only on the misses, by Months._new_year_postpones.
+
+Enable with the context manager, or for the whole process with the environment
+variable HDATE_INSTRUMENT=1, which prints a report to stderr at exit.
+
+Example:
+    >>> with instrument() as stats:
+    ...     _ = molad.Months.days_diff(HDate(1, 1, 5784), HDate(1, 1, 5785))
+    >>> stats.calls("Months.days_diff")
+    1
+"""
+
+import atexit
+import functools
+import os
+import sys
+import time
+import typing
+
+from . import ecliptic_lat
+from . import molad
+from . import moon
+from . import sun
+from . import view_arc
+from .hdate import HDate
+
+ENVIRONMENT_VARIABLE = "HDATE_INSTRUMENT"
+
+INSTRUMENTED = (
+    (molad.Months, "_year_info"),
+    (molad.Months, "_new_year_postpones"),
+    (molad.Months, "days_diff"),
+    (molad.Months, "_diff_to_date"),
+    (molad.Months, "molad_day"),
+    (sun.Sun, "location"),
+    (sun.Sun, "mean_location"),
+    (sun.Sun, "aphelion"),
+    (moon.Moon, "true_location"),
+    (moon.Moon, "mean_location"),
+    (moon.Moon, "mean_location_on_sunset"),
+    (moon.Moon, "true_path"),
+    (ecliptic_lat.EclipticLatitude, "compute"),
+    (view_arc.ViewArc, "compute"),
+    (view_arc.ViewArc, "is_seen"),
+)
+
+# (name, function returning functools cache_info) of the reported caches
+CACHES = (("Months.year_info", molad.Months.year_info_cache_info),)
+
+
+class CallStats(typing.NamedTuple):
+    calls: int
+    seconds: float  # cumulative
+
+
+class CacheStats(typing.NamedTuple):
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class Stats(object):
+    """
+    Counters recorded while instrumentation is enabled
+    """
+
+    def __init__(self):
+        self.functions = {
+            f"{cls.__name__}.{name}": [0, 0.0] for cls, name in INSTRUMENTED
+        }
+        self._caches_begin = {}
+        self._caches_end = {}
+
+    def calls(self, name: str):
+        return self.functions[name][0]
+
+    def function_stats(self):
+        """
+        {name: CallStats} of the functions that were called
+        """
+        return {
+            name: CallStats(calls, seconds)
+            for name, (calls, seconds) in self.functions.items()
+            if calls
+        }
+
+    def cache_stats(self):
+        """
+        {name: CacheStats} of the caches, counted while enabled
+        """
+        caches = {}
+        for name, cache_info in CACHES:
+            begin = self._caches_begin.get(name)
+            if begin is None:
+                continue
+            end = self._caches_end.get(name) or cache_info()
+            caches[name] = CacheStats(end.hits - begin.hits, end.misses - begin.misses)
+        return caches
+
+    def report(self):
+        """
+        Text table of the counters, the slowest functions first
+        """
+        functions = sorted(
+            self.function_stats().items(),
+            key=lambda item: item[1].seconds,
+            reverse=True,
+        )
+        width = max([len(name) for name, _ in functions] + [len("function")])
+        lines = [f"{'function':<{width}} {'calls':>10} {'seconds':>10} {'us/call':>10}"]
+        for name, stats in functions:
+            lines.append(
+                f"{name:<{width}} {stats.calls:>10} {stats.seconds:>10.3f}"
+                f" {stats.seconds / stats.calls * 1e6:>10.1f}"
+            )
+        for name, stats in self.cache_stats().items():
+            lines.append(
+                f"cache {name}: {stats.hits} hits, {stats.misses} misses"
+                f" ({stats.hit_rate:.1%})"
+            )
+        return "\n".join(lines)
+
+
+_originals = {}
+_active = None
+
+
+def _wrap(function, counters):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            counters[0] += 1
+            counters[1] += time.perf_counter() - start
+
+    # keep the counters of a cached function (see CACHES) reachable
+    for name in ("cache_info", "cache_clear"):
+        if hasattr(function, name):
+            setattr(wrapper, name, getattr(function, name))
+    return wrapper
+
+
+def enable(stats: typing.Optional[Stats] = None):
+    """
+    Start recording into stats (a new Stats by default), returns it
+    """
+    global _active
+    if _active is not None:
+        raise RuntimeError("instrumentation is already enabled")
+    stats = stats or Stats()
+    for cls, name in INSTRUMENTED:
+        original = cls.__dict__[name]
+        _originals[cls, name] = original
+        counters = stats.functions[f"{cls.__name__}.{name}"]
+        setattr(cls, name, staticmethod(_wrap(original.__func__, counters)))
+    for name, cache_info in CACHES:
+        stats._caches_begin[name] = cache_info()
+        stats._caches_end.pop(name, None)
+    _active = stats
+    return stats
+
+
+def disable():
+    """
+    Stop recording and restore the original functions, returns the Stats
+    """
+    global _active
+    stats = _active
+    if stats is None:
+        return None
+    for name, cache_info in CACHES:
+        stats._caches_end[name] = cache_info()
+    for (cls, name), original in _originals.items():
+        setattr(cls, name, original)
+    _originals.clear()
+    _active = None
+    return stats
+
+
+def is_enabled():
+    return _active is not None
+
+
+class instrument(object):
+    """
+    Context manager recording the calls of the instrumented functions
+    """
+
+    def __init__(self, stats: typing.Optional[Stats] = None):
+        self.stats = stats
+
+    def __enter__(self):
+        self.stats = enable(self.stats)
+        return self.stats
+
+    def __exit__(self, *exc_info):
+        disable()
+        return False
+
+
+def _report_at_exit():
+    stats = disable()
+    if stats is not None:
+        print(stats.report(), file=sys.stderr)
+
+
+def enable_from_environment():
+    """
+    Enable until the process exits when HDATE_INSTRUMENT is set (not "0")
+    """
+    if os.environ.get(ENVIRONMENT_VARIABLE, "0") not in ("", "0") and not _active:
+        enable()
+        atexit.register(_report_at_exit)
@@ -4,7 +4,8 @@ New moon computations
 
 import typing
 from enum import Enum
-import math
+import bisect
+import functools
 
 from .leap_years import leapYear
 from . import duration
@@ -17,6 +18,11 @@ try:
 except ImportError:
     ephem = None
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class YearType(Enum):
     """
@@ -62,6 +68,257 @@ YEARS_PATTERNS_NON_LEAP = {
 YEARS_PATTERNS = YEARS_PATTERNS_LEAP | YEARS_PATTERNS_NON_LEAP
 
 
+def _pattern_order(pattern: str):
+    return gematria.str_to_num(pattern[0]), "חכש".index(pattern[1])
+
+
+# Patterns ordered by leap, weekday of ראש השנה and year type, used as codes
+YEARS_PATTERNS_CODES = sorted(YEARS_PATTERNS_NON_LEAP, key=_pattern_order) + sorted(
+    YEARS_PATTERNS_LEAP, key=_pattern_order
+)
+
+PARTS_PER_DAY = duration.duration.HOURS_PER_DAY * duration.duration.PARTS_PER_HOUR
+SINODAL_MONTH_PARTS = duration.sinodal_month.as_parts()
+FIRST_MONTH_PARTS = duration.first_month.as_parts()
+MONTHS_IN_CYCLE = leapYear.months_in_cycle()
+
+
+def _months_length(is_leap: bool, year_type: YearType):
+    """
+    Months lengths of a year by its leap state and type. פרק ח הלכה ה-ו
+    """
+    lengths = [30, 29] * 6
+    if is_leap:
+        lengths.insert(5, 30)
+
+    # פרק ח הלכה ו
+    if year_type == YearType.FULL:
+        lengths[1] = 30
+    if year_type == YearType.PARTIAL:
+        lengths[2] = 29
+
+    return lengths
+
+
+def _months_begin(is_leap: bool, year_type: YearType):
+    """
+    Days from the beginning of the year to the first day of each month
+    """
+    begins = [0]
+    for length in _months_length(is_leap, year_type):
+        begins.append(begins[-1] + length)
+    return begins
+
+
+MONTHS_BEGIN = {
+    (is_leap, year_type): _months_begin(is_leap, year_type)
+    for is_leap in YEAR_TYPES
+    for year_type in YearType
+}
+
+YEAR_INFO_CACHE_SIZE = 8192
+
+# The molad of תשרי repeats on the same weekday and time, in the same place of the
+# leap years cycle, every YEARS_PERIOD years
+YEARS_PERIOD = 689472
+
+
+def _pattern_info(pattern: str):
+    """
+    Get the pattern, year type and days of a year pattern
+    """
+    year_type = YearType("חכש".index(pattern[1]) + YearType.PARTIAL.value)
+    days = sum(_months_length(pattern in YEARS_PATTERNS_LEAP, year_type))
+    return pattern, year_type, days
+
+
+YEARS_PATTERNS_CODES_INFO = [_pattern_info(p) for p in YEARS_PATTERNS_CODES]
+
+
+def _pattern_weekdays(pattern: str):
+    """
+    Get the weekday of each day of the year (0 based) of a year pattern
+    """
+    _, _, days = _pattern_info(pattern)
+    year_weekday = gematria.str_to_num(pattern[0])
+    return tuple((year_weekday + day - 1) % 7 + 1 for day in range(days))
+
+
+# weekday per pattern and day of the year (0 based)
+WEEKDAYS_INDEX = {pattern: _pattern_weekdays(pattern) for pattern in YEARS_PATTERNS}
+
+
+def _dates_weekdays():
+    """
+    Collect the weekdays of each date, in all the years patterns
+    """
+    dates_weekdays = {}
+    for pattern, weekdays in WEEKDAYS_INDEX.items():
+        is_leap = pattern in YEARS_PATTERNS_LEAP
+        _, year_type, _ = _pattern_info(pattern)
+        months_begin = MONTHS_BEGIN[is_leap, year_type]
+        for month, (begin, end) in enumerate(zip(months_begin, months_begin[1:])):
+            for day in range(end - begin):
+                date_weekdays = dates_weekdays.setdefault(
+                    (is_leap, month + 1, day + 1), set()
+                )
+                date_weekdays.add(weekdays[begin + day])
+    return {date: tuple(sorted(days)) for date, days in dates_weekdays.items()}
+
+
+# weekdays a date (is_leap, month, day) may fall on
+DATES_WEEKDAYS = _dates_weekdays()
+
+period_table = None
+
+
+def set_period_table(table):
+    """
+    Use a table of pattern code per year of the period (see hdate.period_table)
+    in year_type, year_pattern and year_days. None to stop using it.
+    """
+    global period_table
+    period_table = table
+
+
+year_cache = None
+
+
+def set_year_cache(table):
+    """
+    Use a YearTable (see hdate.year_cache) in year_info and year_table for the
+    years it contains. None to stop using it.
+    """
+    global year_cache
+    year_cache = table
+
+
+class YearInfo(typing.NamedTuple):
+    """
+    Computed data of a single year, see Months.year_info
+    """
+
+    year: int
+    is_leap: bool
+    weekday: int  # weekday of ראש השנה, Sunday is 1
+    postpones: typing.Tuple[bool, bool, bool, bool]  # see apply_postpone_rules
+    year_type: YearType
+    pattern: str
+    months_length: typing.Tuple[int, ...]
+    elapsed_days: int  # days from the beginning (1,1,1) to ראש השנה
+
+    @property
+    def days(self):
+        """
+        Number of days in the year
+        """
+        return sum(self.months_length)
+
+    @property
+    def months_begin(self):
+        """
+        Days from ראש השנה to the first day of each month
+        """
+        return MONTHS_BEGIN[self.is_leap, self.year_type]
+
+    def date_weekday(
+        self, month: typing.Union[int, str], month_day: typing.Union[int, str]
+    ):
+        """
+        Weekday of a date in the year, Sunday is 1
+        """
+        month = gematria.month_to_num(self.is_leap, month)
+        month_day = gematria.str_to_num(month_day)
+        return self._day_weekday(self.months_begin[month - 1] + month_day - 1)
+
+    def _day_weekday(self, day_of_year: int):
+        """
+        Weekday of a day of the year (0 based), Sunday is 1
+        """
+        weekdays = WEEKDAYS_INDEX[self.pattern]
+        if 0 <= day_of_year < len(weekdays):
+            return weekdays[day_of_year]
+        # HDate does not validate, days out of the year continue the weeks
+        return (self.weekday + day_of_year - 1) % 7 + 1
+
+    @property
+    def passover_weekday(self):
+        """
+        Weekday of פסח (ט"ו בניסן), Sunday is 1
+        """
+        return self.date_weekday("ניסן", 15)
+
+
+class YearTable(typing.NamedTuple):
+    """
+    Computed data of a range of years, column per field, see Months.year_table
+    """
+
+    year: "np.ndarray"
+    is_leap: "np.ndarray"
+    weekday: "np.ndarray"  # weekday of ראש השנה, Sunday is 1
+    postpones: "np.ndarray"  # (years, 4) see apply_postpone_rules
+    year_type: "np.ndarray"  # YearType values
+    pattern: "np.ndarray"  # index in YEARS_PATTERNS_CODES
+    days: "np.ndarray"
+    elapsed_days: "np.ndarray"  # days from the beginning (1,1,1) to ראש השנה
+
+
+class MoladTable(typing.NamedTuple):
+    """
+    Mean new moons of a range of months, column per field, see Months.molad_table
+    """
+
+    year: "np.ndarray"
+    month: "np.ndarray"  # month number within its year
+    weekday: "np.ndarray"  # as in Months.molad_day, Saturday is 0
+    hours: "np.ndarray"
+    parts: "np.ndarray"
+    day: "np.ndarray"  # days from the beginning (1,1,1), see day_to_date_array
+
+
+# method: (first tkufa before the molad of ניסן, sun year, round to hours)
+TKUFOT_METHODS = {
+    "shmuel": (  # פרק ט
+        duration.first_tkufa_diff_shmuel,
+        duration.days_in_sun_year_shmuel,
+        True,
+    ),
+    "rav_ada": (  # פרק י
+        duration.first_tkufa_diff_rav_ada,
+        duration.days_in_sun_year_rav_ada,
+        False,
+    ),
+}
+
+
+# Hebrew dates arrays are packed as year * 10000 + month * 100 + day
+PACKED_YEAR = 10000
+PACKED_MONTH = 100
+
+
+def pack_dates(year, month, day):
+    """
+    Pack arrays of hebrew dates into a single integer array
+
+    >>> pack_dates(5783, 6, 26)
+    57830626
+    """
+    return year * PACKED_YEAR + month * PACKED_MONTH + day
+
+
+def unpack_dates(packed):
+    """
+    Unpack an integer array of hebrew dates to years, months and days arrays
+
+    >>> unpack_dates(57830626)
+    (5783, 6, 26)
+    """
+    year, month_day = divmod(packed, PACKED_YEAR)
+    month, day = divmod(month_day, PACKED_MONTH)
+    return year, month, day
+
+
 def to_georgian_BC(hdate: HDate):
     h_first = HDate(25, 12, 0)
     # According to wikipedia, it should be -3760,9,21
@@ -70,19 +327,51 @@ def to_georgian_BC(hdate: HDate):
     return ephem.Date(e_first + days)
 
 
+GEORGIAN_ONE = HDate("יח", "טבת", "ג-תשסא")  # date(1, 1, 1)
+EPOCH_DATETIME64 = date(1970, 1, 1)
+
+
 def to_georgian(hdate: HDate):
-    h_one = HDate("יח", "טבת", "ג-תשסא")
     g_one = date(1, 1, 1)
-    days = Months.days_diff(h_one, hdate)
+    days = Months.days_diff(GEORGIAN_ONE, hdate)
     return g_one + timedelta(days=days)
 
 
+def to_georgian_array(packed):
+    """
+    Convert an array of packed hebrew dates (see pack_dates) to datetime64[D] array
+
+    >>> to_georgian_array(np.array([57830626, 57840101]))
+    array(['2023-03-19', '2023-09-16'], dtype='datetime64[D]')
+    """
+    days = Months.absolute_day_array(packed) - Months.absolute_day(GEORGIAN_ONE)
+    return (days + (date(1, 1, 1) - EPOCH_DATETIME64).days).astype("datetime64[D]")
+
+
+def from_georgian_array(gdates):
+    """
+    Convert an array of georgian dates to packed hebrew dates (see pack_dates)
+    Dates may be datetime64 or ordinals (as date.toordinal)
+
+    >>> from_georgian_array(np.array(["2023-03-19", "2023-09-16"], dtype="datetime64[D]"))
+    array([57830626, 57840101])
+    >>> from_georgian_array([date(2023, 3, 19).toordinal()])
+    array([57830626])
+    """
+    gdates = np.asarray(gdates)
+    if gdates.dtype.kind == "M":
+        days = gdates.astype("datetime64[D]").astype(np.int64)
+        days = days + (EPOCH_DATETIME64 - date(1, 1, 1)).days
+    else:
+        days = gdates.astype(np.int64) - 1
+    return Months.day_to_date_array(days + Months.absolute_day(GEORGIAN_ONE))
+
+
 def from_georgian(gdate: typing.Union[date, ephem.Date]):
     if type(gdate) == date:
-        h_one = HDate("יח", "טבת", "ג-תשסא")
         g_one = date(1, 1, 1)
         days = (gdate - g_one).days
-        return Months.date_add_days(h_one, days)
+        return Months.date_add_days(GEORGIAN_ONE, days)
     h_first = HDate(25, 12, 0)
     # According to wikipedia, it should be -3760,9,21
     e_first = ephem.Date("-3760/9/22")
@@ -140,6 +429,19 @@ class Months:
             months += leapYear.months(year)
         return max(0, months)
 
+    @staticmethod
+    def _months_elapsed(year: int):
+        """
+        Return number of months from the beginning to year's תשרי. O(1) closed form.
+        Years before the first year are counted as the first year.
+
+        >>> Months._months_elapsed(1)
+        0
+        >>> Months._months_elapsed(5782)
+        71501
+        """
+        return max(0, (MONTHS_IN_CYCLE * (year - 1) + 1) // leapYear.CYCLE)
+
     @staticmethod
     def months_till(
         year: typing.Union[int, str], month: typing.Union[int, str] = 1, begin=1
@@ -306,11 +608,427 @@ class Months:
 
         Verified with https://he-date.info/moladcalculateyear.html
         """
-        year = gematria.year_to_num(year)
+        info = Months.year_info(year)
+        return info.weekday, list(info.postpones)
+
+    @staticmethod
+    def _new_year_postpones(year: int):
+        """
+        Compute the molad of תשרי in parts and apply the postpone rules on it.
+        Integer equivalent of apply_postpone_rules.
+
+        returns : molad's day (1 is the first Sunday), activated rules
+
+        >>> Months._new_year_postpones(5782)
+        (2111469, [False, False, False, False])
+        >>> Months._new_year_postpones(5789)
+        (2114038, [True, False, True, False])
+        """
+        months = Months._months_elapsed(year)
+        molad_day, molad_parts = divmod(
+            FIRST_MONTH_PARTS + SINODAL_MONTH_PARTS * months, PARTS_PER_DAY
+        )
+        weekday = molad_day % 7  # Saturday is 0
+        activated = [False] * 4
+        # פרק ז הלכה ב
+        if molad_parts >= 18 * duration.duration.PARTS_PER_HOUR:
+            activated[1] = True
+        # פרק ז הלכה ד
+        elif (
+            weekday == 3
+            and molad_parts >= 9 * duration.duration.PARTS_PER_HOUR + 204
+            and not leapYear.is_leap(year)
+        ):
+            activated[2] = True
+        # פרק ז הלכה ה
+        elif (
+            weekday == 2
+            and molad_parts >= (12 + 3) * duration.duration.PARTS_PER_HOUR + 589
+            and leapYear.is_leap(year - 1)
+        ):
+            activated[3] = True
+        # פרק ז הלכה א
+        if (weekday + any(activated)) % 7 in (1, 4, 6):
+            activated[0] = True
+        return molad_day, activated
+
+    @staticmethod
+    def _elapsed_days(year: int):
+        """
+        Count days from the beginning (1,1,1) to ראש השנה, without the cache
+        """
+        molad_day, postpones = Months._new_year_postpones(year)
+        return molad_day + sum(postpones) - duration.first_month.days
+
+    @staticmethod
+    def year_info(year: typing.Union[int, str]):
+        """
+        Get all the computed data of a year at once.
+        Served from a bounded LRU cache, see year_info_cache_info
+
+        Examples:
+            >>> info = Months.year_info(5787)
+            >>> info.weekday, info.postpones, info.pattern, info.days
+            (7, (False, False, False, False), 'זשה', 385)
+        """
+        return Months._year_info(gematria.year_to_num(year))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=YEAR_INFO_CACHE_SIZE)
+    def _year_info(year: int):
+        index = Months._year_cache_index(year)
+        if index is not None:
+            return Months._year_info_from_table(year_cache, index)
         is_leap = leapYear.is_leap(year)
-        is_former_leap = leapYear.is_leap(year - 1)
-        molad = Months.molad_day(year, 1)
-        return Months.apply_postpone_rules(molad, is_former_leap, is_leap)
+        molad_day, postpones = Months._new_year_postpones(year)
+        elapsed_days = molad_day + sum(postpones) - duration.first_month.days
+        next_elapsed_days = Months._elapsed_days(year + 1)
+        # the first day (0) is Monday
+        weekday = (elapsed_days + 1) % 7 + 1
+        year_type = YEAR_TYPES[is_leap][(next_elapsed_days - elapsed_days - 1) % 7]
+        months_length = _months_length(is_leap, year_type)
+
+        days_to_passover = sum(months_length[: 6 + is_leap]) + 14
+        passover_weekday = (weekday + days_to_passover - 1) % 7 + 1
+        pattern = (
+            gematria.num_to_str(weekday)
+            + YearTypeChar[year_type]
+            + gematria.num_to_str(passover_weekday)
+        )
+        return YearInfo(
+            year,
+            is_leap,
+            weekday,
+            tuple(postpones),
+            year_type,
+            pattern,
+            tuple(months_length),
+            elapsed_days,
+        )
+
+    @staticmethod
+    def _year_info_from_table(table: YearTable, index: int):
+        pattern, year_type, _ = YEARS_PATTERNS_CODES_INFO[table.pattern[index]]
+        is_leap = bool(table.is_leap[index])
+        return YearInfo(
+            int(table.year[index]),
+            is_leap,
+            int(table.weekday[index]),
+            tuple(table.postpones[index].tolist()),
+            year_type,
+            pattern,
+            tuple(_months_length(is_leap, year_type)),
+            int(table.elapsed_days[index]),
+        )
+
+    @staticmethod
+    def _year_cache_index(year: int):
+        """
+        The index of a year in the year cache, None if it does not contain it
+        """
+        if year_cache is None or len(year_cache.year) == 0:
+            return None
+        index = year - int(year_cache.year[0])
+        if index < 0 or index >= len(year_cache.year):
+            return None
+        return index
+
+    @staticmethod
+    def _year_cache_slice(start: int, end: int):
+        """
+        The years [start, end) from the year cache, None if it does not contain them
+        """
+        if year_cache is None or len(year_cache.year) == 0:
+            return None
+        first = int(year_cache.year[0])
+        if start < first or end > first + len(year_cache.year):
+            return None
+        return YearTable(
+            *(column[start - first : end - first] for column in year_cache)
+        )
+
+    @staticmethod
+    def year_info_cache_info():
+        """
+        Get the hits and misses counters of the year_info cache
+        """
+        return Months._year_info.cache_info()
+
+    @staticmethod
+    def year_info_cache_clear():
+        """
+        Clear the year_info cache and its counters
+        """
+        Months._year_info.cache_clear()
+
+    @staticmethod
+    def year_table(start: typing.Union[int, str], end: typing.Union[int, str]):
+        """
+        Compute the data of all years in range [start, end) at once, using numpy
+
+        Examples:
+            >>> table = Months.year_table(5780, 5790)
+            >>> table.days.tolist()
+            [355, 353, 384, 355, 383, 355, 354, 385, 355, 354]
+            >>> [YEARS_PATTERNS_CODES[code] for code in table.pattern[:3]]
+            ['בשה', 'זחא', 'גכז']
+        """
+        start = gematria.year_to_num(start)
+        end = gematria.year_to_num(end)
+        cached = Months._year_cache_slice(start, max(start, end))
+        if cached is not None:
+            return cached
+        # one more year, for the length of the last year
+        years = np.arange(start, max(start, end) + 1, dtype=np.int64)
+        is_leap_cycle = np.array(leapYear.IS_LEAP)
+        is_leap = is_leap_cycle[(years - 1) % leapYear.CYCLE]
+        is_former_leap = is_leap_cycle[(years - 2) % leapYear.CYCLE]
+
+        months = np.maximum(0, (MONTHS_IN_CYCLE * (years - 1) + 1) // leapYear.CYCLE)
+        molad_day, molad_parts = np.divmod(
+            FIRST_MONTH_PARTS + SINODAL_MONTH_PARTS * months, PARTS_PER_DAY
+        )
+        weekday = molad_day % 7  # Saturday is 0
+        postpones = np.zeros((len(years), 4), dtype=bool)
+        # פרק ז הלכה ב
+        postpones[:, 1] = molad_parts >= 18 * duration.duration.PARTS_PER_HOUR
+        # פרק ז הלכה ד
+        postpones[:, 2] = (
+            ~postpones[:, 1]
+            & (weekday == 3)
+            & (molad_parts >= 9 * duration.duration.PARTS_PER_HOUR + 204)
+            & ~is_leap
+        )
+        # פרק ז הלכה ה
+        postpones[:, 3] = (
+            ~postpones[:, 1]
+            & ~postpones[:, 2]
+            & (weekday == 2)
+            & (molad_parts >= (12 + 3) * duration.duration.PARTS_PER_HOUR + 589)
+            & is_former_leap
+        )
+        # פרק ז הלכה א
+        postponed = postpones[:, 1:].any(axis=1)
+        postpones[:, 0] = np.isin((weekday + postponed) % 7, (1, 4, 6))
+        elapsed_days = molad_day + postpones.sum(axis=1) - duration.first_month.days
+
+        # YEAR_TYPES, from the weekdays difference of the following ראש השנה
+        weekdays_diff = (np.diff(elapsed_days) - 1) % 7
+        is_leap = is_leap[:-1]
+        year_type = weekdays_diff - 1 - 2 * is_leap
+        days = 353 + 30 * is_leap + year_type - YearType.PARTIAL.value
+
+        elapsed_days = elapsed_days[:-1]
+        weekday = (elapsed_days + 1) % 7 + 1
+        pattern_codes = np.full((2, 8, len(YearType) + 1), -1, dtype=np.int8)
+        for code, pattern in enumerate(YEARS_PATTERNS_CODES):
+            pattern_is_leap = pattern in YEARS_PATTERNS_LEAP
+            pattern_weekday = gematria.str_to_num(pattern[0])
+            pattern_type = "חכש".index(pattern[1]) + YearType.PARTIAL.value
+            pattern_codes[int(pattern_is_leap), pattern_weekday, pattern_type] = code
+
+        return YearTable(
+            years[:-1],
+            is_leap,
+            weekday.astype(np.int8),
+            postpones[:-1],
+            year_type.astype(np.int8),
+            pattern_codes[is_leap.astype(np.int8), weekday, year_type],
+            days.astype(np.int16),
+            elapsed_days,
+        )
+
+    @staticmethod
+    def molad_table(start: typing.Union[int, str], end: typing.Union[int, str]):
+        """
+        Compute the mean new moons of all months of years in range [start, end)
+        at once, using numpy
+
+        Examples:
+            >>> table = Months.molad_table(5782, 5783)
+            >>> len(table.month)
+            13
+            >>> [int(table[i][7]) for i in range(1, 5)]
+            [8, 6, 22, 648]
+            >>> dates = Months.day_to_date_array(table.day[:2])
+            >>> [column.tolist() for column in unpack_dates(dates)]
+            [[5782, 5782], [1, 1], [1, 30]]
+        """
+        start = max(1, gematria.year_to_num(start))
+        end = max(start, gematria.year_to_num(end))
+        years = np.arange(start, end, dtype=np.int64)
+        is_leap = np.array(leapYear.IS_LEAP)[(years - 1) % leapYear.CYCLE]
+        months_in_year = 12 + is_leap.astype(np.int64)
+        months_count = int(months_in_year.sum())
+
+        # פרק ו הלכה יד
+        months_elapsed = Months._months_elapsed(start) + np.arange(
+            months_count, dtype=np.int64
+        )
+        molad_day, molad_parts = np.divmod(
+            FIRST_MONTH_PARTS + SINODAL_MONTH_PARTS * months_elapsed, PARTS_PER_DAY
+        )
+        hours, parts = np.divmod(molad_parts, duration.duration.PARTS_PER_HOUR)
+
+        year_first_month = np.cumsum(months_in_year) - months_in_year
+        months_years = np.repeat(years, months_in_year)
+        months = np.arange(months_count) - np.repeat(year_first_month, months_in_year)
+        return MoladTable(
+            months_years,
+            (months + 1).astype(np.int8),
+            (molad_day % 7).astype(np.int8),
+            hours.astype(np.int8),
+            parts.astype(np.int16),
+            molad_day - duration.first_month.days,
+        )
+
+    @staticmethod
+    def molad_day_array(packed):
+        """
+        Vectorized version of molad_day, for the months of packed hebrew dates
+        (see pack_dates)
+
+        returns : weekday (Saturday is 0), hours and parts arrays
+
+        Examples:
+            >>> weekday, hours, parts = Months.molad_day_array([57820815, 57820101])
+            >>> weekday.tolist(), hours.tolist(), parts.tolist()
+            ([6, 3], [22, 5], [648, 497])
+        """
+        year, month, _ = unpack_dates(np.asarray(packed, dtype=np.int64))
+        # פרק ו הלכה יד
+        months_elapsed = (
+            np.maximum(0, (MONTHS_IN_CYCLE * (year - 1) + 1) // leapYear.CYCLE)
+            + month
+            - 1
+        )
+        molad_day, molad_parts = np.divmod(
+            FIRST_MONTH_PARTS + SINODAL_MONTH_PARTS * months_elapsed, PARTS_PER_DAY
+        )
+        hours, parts = np.divmod(molad_parts, duration.duration.PARTS_PER_HOUR)
+        return molad_day % 7, hours, parts
+
+    @staticmethod
+    def _months_begin_array():
+        """
+        Days from ראש השנה to the first day of each month, by (leap, type) kind
+        Kind is is_leap * 3 + year_type - 1, months are 1 based
+        """
+        months_begin = np.zeros((2 * len(YearType), 14 + 1), dtype=np.int64)
+        for (is_leap, year_type), begins in MONTHS_BEGIN.items():
+            kind = is_leap * len(YearType) + year_type.value - 1
+            months_begin[kind, 1 : len(begins) + 1] = begins
+        return months_begin
+
+    @staticmethod
+    def absolute_day_array(packed):
+        """
+        Count days from the beginning (1,1,1) to each of packed hebrew dates array
+        Vectorized version of absolute_day, see pack_dates
+
+        Raises ValueError for a month or a day which is not in its year
+
+        Examples:
+            >>> Months.absolute_day_array(np.array([10101, 57830626]))
+            array([      0, 2112025])
+            >>> Months.absolute_day_array(np.array([57831301]))
+            Traceback (most recent call last):
+            ...
+            ValueError: 57831301 is not a valid date, the year has 12 months
+        """
+        packed = np.asarray(packed, dtype=np.int64)
+        year, month, day = unpack_dates(packed)
+        if year.size == 0:
+            return np.zeros(year.shape, dtype=np.int64)
+        first_year = year.min()
+        table = Months.year_table(first_year, year.max() + 1)
+        index = year - first_year
+        kind = table.is_leap[index] * len(YearType) + table.year_type[index] - 1
+
+        months = 12 + table.is_leap[index].astype(np.int64)
+        invalid = (month < 1) | (month > months)
+        if invalid.any():
+            first = np.flatnonzero(invalid)[0]
+            raise ValueError(
+                f"{packed.flat[first]} is not a valid date,"
+                f" the year has {months.flat[first]} months"
+            )
+        months_begin = Months._months_begin_array()
+        month_length = months_begin[kind, month + 1] - months_begin[kind, month]
+        invalid = (day < 1) | (day > month_length)
+        if invalid.any():
+            first = np.flatnonzero(invalid)[0]
+            raise ValueError(
+                f"{packed.flat[first]} is not a valid date,"
+                f" the month has {month_length.flat[first]} days"
+            )
+        return table.elapsed_days[index] + months_begin[kind, month] + day - 1
+
+    @staticmethod
+    def day_to_date_array(days):
+        """
+        Compute the dates with specific numbers of days for the begining (1,1,1)
+        Vectorized version of _diff_to_date, returns packed dates, see pack_dates
+
+        Examples:
+            >>> Months.day_to_date_array(np.array([1, 30, 355, 2112025]))
+            array([   10102,    10201,    20101, 57830626])
+        """
+        days = np.asarray(days, dtype=np.int64)
+        if days.size == 0:
+            return np.zeros(days.shape, dtype=np.int64)
+        if days.min() < 0:
+            raise ValueError("Days before the beginning are not supported")
+        min_days_in_year, max_days_in_year = 353, 385
+        first_year = max(1, days.min() // max_days_in_year)
+        last_year = days.max() // min_days_in_year + 2
+        table = Months.year_table(first_year, last_year + 1)
+
+        index = np.searchsorted(table.elapsed_days, days, side="right") - 1
+        day_in_year = days - table.elapsed_days[index]
+        kind = table.is_leap[index] * len(YearType) + table.year_type[index] - 1
+        months_begin = Months._months_begin_array()
+        # month of each day in the year, by kind
+        months_of_day = np.zeros((len(months_begin), max_days_in_year), dtype=np.int64)
+        for (is_leap, year_type), begins in MONTHS_BEGIN.items():
+            months_kind = is_leap * len(YearType) + year_type.value - 1
+            months_of_day[months_kind] = np.searchsorted(
+                begins, np.arange(max_days_in_year), side="right"
+            )
+        month = months_of_day[kind, day_in_year]
+        day = day_in_year - months_begin[kind, month] + 1
+        return pack_dates(table.year[index], month, day)
+
+    @staticmethod
+    def elapsed_days(year: typing.Union[int, str]):
+        """
+        Count days from the beginning (1,1,1) to ראש השנה of a specific year. O(1) method.
+
+        Examples:
+            >>> Months.elapsed_days(1)
+            0
+            >>> Months.elapsed_days(2)
+            355
+            >>> Months.elapsed_days(5783)
+            2111851
+        """
+        return Months.year_info(year).elapsed_days
+
+    @staticmethod
+    def absolute_day(date: HDate):
+        """
+        Count days from the beginning (1,1,1) to a specific date. O(1) method.
+
+        Examples:
+            >>> Months.absolute_day(HDate(1, 1, 1))
+            0
+            >>> Months.absolute_day(HDate(26, 6, 5783))
+            2112025
+        """
+        info = Months._year_info(date._year)
+        return (
+            info.elapsed_days + info.months_begin[date._month - 1] + date._month_day - 1
+        )
 
     @staticmethod
     def year_type(year: typing.Union[int, str]):
@@ -326,11 +1044,9 @@ class Months:
             <YearType.PARTIAL: 1>
         """
         year = gematria.year_to_num(year)
-        is_leap = leapYear.is_leap(year)
-        year_begin_weekday, _ = Months.year_begin_weekday(year)
-        next_first_month_head, _ = Months.year_begin_weekday(year + 1)
-        days_diff = (next_first_month_head - year_begin_weekday - 1) % 7
-        return YEAR_TYPES[is_leap][days_diff]
+        if period_table is not None and year >= 1:
+            return Months._period_table_info(year)[1]
+        return Months._year_info(year).year_type
 
     @staticmethod
     def year_pattern(year: typing.Union[int, str]):
@@ -346,25 +1062,17 @@ class Months:
             'זשה'
 
         """
-        year_type = Months.year_type(year)
-        rosh_hashona_weekday = Months.year_begin_weekday(year)[0]
-        is_leap = leapYear.is_leap(year)
-        days_to_passover = 30 + 29 + 29 + 29 + 30 + 29 + 14
-        if is_leap:
-            days_to_passover += 30
-        if year_type == YearType.FULL:
-            days_to_passover += 2
-        elif year_type == YearType.ORDINAL:
-            days_to_passover += 1
-        passover_weekday = (rosh_hashona_weekday + days_to_passover) % 7
-        if passover_weekday == 0:
-            passover_weekday = 7
+        year = gematria.year_to_num(year)
+        if period_table is not None and year >= 1:
+            return Months._period_table_info(year)[0]
+        return Months._year_info(year).pattern
 
-        return (
-            gematria.num_to_str(rosh_hashona_weekday)
-            + YearTypeChar[year_type]
-            + gematria.num_to_str(passover_weekday)
-        )
+    @staticmethod
+    def _period_table_info(year: int):
+        """
+        Pattern, year type and days of a year, from the period table
+        """
+        return YEARS_PATTERNS_CODES_INFO[period_table[(year - 1) % YEARS_PERIOD]]
 
     @staticmethod
     def months_length(year: typing.Union[int, str]):
@@ -377,19 +1085,7 @@ class Months:
             >>> Months.months_length(5782)
             [30, 29, 30, 29, 30, 30, 29, 30, 29, 30, 29, 30, 29]
         """
-        is_leap = leapYear.is_leap(year)
-        year_type = Months.year_type(year)
-        lengths = [30, 29] * 6
-        if is_leap:
-            lengths.insert(5, 30)
-
-        # פרק ח הלכה ו
-        if year_type == YearType.FULL:
-            lengths[1] = 30
-        if year_type == YearType.PARTIAL:
-            lengths[2] = 29
-
-        return lengths
+        return list(Months.year_info(year).months_length)
 
     @staticmethod
     def year_days(year: typing.Union[int, str]):
@@ -403,7 +1099,10 @@ class Months:
             [355, 353, 384, 355, 383, 355, 354, 385, 355, 354]
         """
 
-        return sum(Months.months_length(year))
+        year = gematria.year_to_num(year)
+        if period_table is not None and year >= 1:
+            return Months._period_table_info(year)[2]
+        return Months._year_info(year).days
 
     @staticmethod
     def weekday(date: HDate):
@@ -421,16 +1120,63 @@ class Months:
             3
         """
 
-        # find day of rosh hashana
-        year_begin_weekday, _ = Months.year_begin_weekday(date._year)
+        info = Months._year_info(date._year)
         # find days to the begining of the month
-        days_from_year_begin = sum(Months.months_length(date._year)[: date._month - 1])
+        days_from_year_begin = info.months_begin[date._month - 1]
         # days from month begin
         days_in_month = date._month_day - 1
-        weekday = (
-            year_begin_weekday + days_from_year_begin + days_in_month - 1
-        ) % 7 + 1
-        return weekday
+        return info._day_weekday(days_from_year_begin + days_in_month)
+
+    @staticmethod
+    def possible_weekdays(
+        month: typing.Union[int, str], month_day: typing.Union[int, str], is_leap: bool
+    ):
+        """
+        Find the weekdays a date may fall on, in a leap or non leap year
+
+        Example:
+            >>> Months.possible_weekdays("תשרי", 1, False)
+            (2, 3, 5, 7)
+            >>> Months.possible_weekdays("ניסן", "טו", True)
+            (1, 3, 5, 7)
+        """
+        month = gematria.month_to_num(is_leap, month)
+        month_day = gematria.str_to_num(month_day)
+        return DATES_WEEKDAYS.get((is_leap, month, month_day), ())
+
+    @staticmethod
+    def iter_days(start: HDate, end: HDate):
+        """
+        Iterate over the days in range [start, end), counting day, month and year.
+        Yields the date, its weekday and its day of the year (1 based)
+
+        Example:
+            >>> for date, weekday, day in Months.iter_days(HDate(29, 13, 5782), HDate(2, 1, 5783)):
+            ...     print(date, weekday, day)
+            בפשת'ה אלול טכ 1 384
+            גפשת'ה תשרי א 2 1
+        """
+        info = Months._year_info(start._year)
+        months_length = info.months_length
+        month_day, month, year = start._month_day, start._month, start._year
+        day_of_year = info.months_begin[month - 1] + month_day
+        weekday = (info.weekday + day_of_year - 2) % 7 + 1
+        set_slot = object.__setattr__
+        for absolute_day in range(start.absolute_day, end.absolute_day):
+            date = HDate(month_day, month, year)
+            set_slot(date, "_absolute_day", absolute_day)
+            yield date, weekday, day_of_year
+            weekday = weekday % 7 + 1
+            day_of_year += 1
+            month_day += 1
+            if month_day > months_length[month - 1]:
+                month_day = 1
+                month += 1
+                if month > len(months_length):
+                    month = 1
+                    year += 1
+                    day_of_year = 1
+                    months_length = Months._year_info(year).months_length
 
     @staticmethod
     def days_diff_o_n_(begin: HDate, end: HDate):
@@ -466,23 +1212,6 @@ class Months:
 
         return max(0, days)
 
-    @staticmethod
-    def _days_to_date(date: HDate):
-        """
-        Count days between beginging (1,1,1) to a specific date
-        """
-        # count the days from the begining of the year
-        days_from_tishrei = Months.days_diff_o_n_(HDate(1, 1, date._year), date)
-
-        # count the duration between first molad and first of Tishrei
-        sinodal_months = Months.months_till(date._year, 1)
-
-        sinodal_months_duration = (
-            duration.sinodal_month * sinodal_months + duration.begining_time
-        )
-        _, postpones = Months.year_begin_weekday(date._year)
-        return sum(postpones) + sinodal_months_duration._days + days_from_tishrei
-
     @staticmethod
     def _diff_to_date(days_diff: int):
         """
@@ -496,27 +1225,21 @@ class Months:
             >>> Months._diff_to_date(355) # length of first year
             HDate(1, 1, 2)
         """
-        # count the full sinodal months
-        sinodal_months = int(
-            math.floor(days_diff / duration.sinodal_month.as_days_fraction())
-        )
-
-        # count full cycles
-        full_cycles = sinodal_months // leapYear.months_in_cycle()
-
-        # find which year are we in
-        year = leapYear.CYCLE * full_cycles + 1
-        sinodal_months -= full_cycles * leapYear.months_in_cycle()
-        while sinodal_months > leapYear.months(year):
-            sinodal_months -= leapYear.months(year)
+        if days_diff < 0:
+            # before the beginning, counted back from the first תשרי
+            return HDate(days_diff + 1, 1, 1)
+        # estimate the year by the molads count, then fix by the postpones
+        sinodal_months = days_diff * PARTS_PER_DAY // SINODAL_MONTH_PARTS
+        year = sinodal_months * leapYear.CYCLE // MONTHS_IN_CYCLE + 1
+        while Months._year_info(year + 1).elapsed_days <= days_diff:
             year += 1
+        while year > 1 and Months._year_info(year).elapsed_days > days_diff:
+            year -= 1
 
-        # days till the begining of the year
-        days_until_year_begin = Months.days_diff(HDate(1, 1, 1), HDate(1, 1, year))
-
-        return Months.date_add_days_o_n_(
-            HDate(1, 1, year), days_diff - days_until_year_begin
-        )
+        info = Months._year_info(year)
+        days_in_year = days_diff - info.elapsed_days
+        month = bisect.bisect_right(info.months_begin, days_in_year)
+        return HDate(days_in_year - info.months_begin[month - 1] + 1, month, year)
 
     @staticmethod
     def date_add_days(date: HDate, days_add: int):
@@ -538,14 +1261,7 @@ class Months:
             HDate(13, 12, 5701)
 
         """
-        # Count days from the beginning to the date
-        days_from_begining_to_date = Months.days_diff(HDate(1, 1, 1), date)
-
-        # Add the given days
-        days_from_begining = days_from_begining_to_date + days_add
-
-        # compute date by days from begining
-        return Months._diff_to_date(days_from_begining)
+        return date + days_add
 
     @staticmethod
     def days_diff(begin: HDate, end: HDate):
@@ -566,7 +1282,7 @@ class Months:
             >>> Months.days_diff_o_n_(HDate(1, 10 , 5783), HDate(1, 10 , 5782))
             0
         """
-        return Months._days_to_date(end) - Months._days_to_date(begin)
+        return end - begin
 
     @staticmethod
     def date_add_days_o_n_(begin: HDate, days: int):
@@ -586,27 +1302,26 @@ class Months:
             HDate(25, 9, 5785)
 
         """
+        month_day, month, year = begin._month_day, begin._month, begin._year
         # Count the days in each month on the given date
-        months_length = Months.months_length(begin._year)
+        months_length = Months.months_length(year)
         while True:
-            days_in_begin_month = min(
-                months_length[begin._month - 1] - begin._month_day, days
-            )
+            days_in_begin_month = min(months_length[month - 1] - month_day, days)
             days -= days_in_begin_month
-            begin._month_day += days_in_begin_month
+            month_day += days_in_begin_month
 
             if not days:
                 break
 
-            begin._month_day = 1
-            begin._month += 1
+            month_day = 1
+            month += 1
             days -= 1
 
-            if begin._month == (len(months_length) + 1):
-                begin._year += 1
-                begin._month = 1
-                months_length = Months.months_length(begin._year)
-        return begin
+            if month == (len(months_length) + 1):
+                year += 1
+                month = 1
+                months_length = Months.months_length(year)
+        return HDate(month_day, month, year)
 
     @staticmethod
     def tkufot_shmuel(year: typing.Union[int, str]):
@@ -622,12 +1337,7 @@ class Months:
             Not including light saving clock calculations
 
         """
-        return Months._tkufot(
-            year,
-            duration.first_tkufa_diff_shmuel,
-            duration.days_in_sun_year_shmuel,
-            hours_only=True,
-        )
+        return Months._tkufot(year, "shmuel")
 
     @staticmethod
     def tkufot_rav_ada(year: typing.Union[int, str]):
@@ -640,40 +1350,71 @@ class Months:
             Not including light saving clock calculations
 
         """
-        return Months._tkufot(
-            year,
-            duration.first_tkufa_diff_rav_ada,
-            duration.days_in_sun_year_rav_ada,
-            hours_only=False,
-        )
+        return Months._tkufot(year, "rav_ada")
 
     @staticmethod
-    def _tkufot(year: typing.Union[int, str], first_tkufa, sun_year, hours_only):
+    def _tkufot(year: typing.Union[int, str], method: str):
         """
         Find all 4 tkufot of the year : תשרי, טבת, ניסן, תמוז
         Internal method to find both shmuel and rav ada's tkufa
 
         """
         year = gematria.year_to_num(year)
+        return Months.tkufot_range(year, year + 1, method)[0]
+
+    @staticmethod
+    def tkufot_range(
+        start: typing.Union[int, str], end: typing.Union[int, str], method: str
+    ):
+        """
+        Find the 4 tkufot of all years in range [start, end), see tkufot_shmuel
+        method is one of TKUFOT_METHODS : "shmuel" or "rav_ada"
+
+        Example :
+            >>> Months.tkufot_range(5782, 5784, "shmuel")[1][0]
+            (HDate(12, 1, 5783), 15, 0.0)
+        """
+        if method not in TKUFOT_METHODS:
+            raise ValueError(f"{method} is not a tkufot method")
+        first_tkufa, sun_year, hours_only = TKUFOT_METHODS[method]
+        start = gematria.year_to_num(start)
+        end = gematria.year_to_num(end)
 
         nissan_first_molad = Months.molad(1, "ניסן")
         nissan_first_tkufa = nissan_first_molad - first_tkufa
-
-        def days_to_tkufa(duration_from_beginning):
-            date = Months.date_add_days(HDate(1, 1, 1), duration_from_beginning.days)
-            return (date, d.hours, d.minutes)
+        tkufa_duration = sun_year / 4
+        tkufot_year_begin = tkufa_duration * 3
+        info = None
+
+        def days_to_date(days):
+            # walk forward from the last year found, the tkufot only advance
+            nonlocal info
+            if days < 0:
+                return Months._diff_to_date(days)
+            if info is None or days < info.elapsed_days:
+                info = Months._year_info(Months._diff_to_date(days)._year)
+            while days >= info.elapsed_days + info.days:
+                info = Months._year_info(info.year + 1)
+            days_in_year = days - info.elapsed_days
+            month = bisect.bisect_right(info.months_begin, days_in_year)
+            return HDate(
+                days_in_year - info.months_begin[month - 1] + 1, month, info.year
+            )
 
         # tkufa of nissan
-        nissans_tkufa_from_begining = sun_year * (year - 1) + nissan_first_tkufa
-        if hours_only:
-            nissans_tkufa_from_begining = duration.duration(
-                nissans_tkufa_from_begining.days, nissans_tkufa_from_begining.hours
-            )
-        tkufa_duration = sun_year / 4
-        tishrey_tkufa_from_begining = nissans_tkufa_from_begining - tkufa_duration * 3
-        d = tishrey_tkufa_from_begining
-        tkufot_list = []
-        for _ in range(4):
-            d = d + tkufa_duration
-            tkufot_list.append(days_to_tkufa(d))
-        return tkufot_list
+        nissans_tkufa_from_begining = sun_year * (start - 1) + nissan_first_tkufa
+        tkufot = []
+        for _ in range(start, end):
+            nissans_tkufa = nissans_tkufa_from_begining
+            if hours_only:
+                nissans_tkufa = duration.duration(
+                    nissans_tkufa.days, nissans_tkufa.hours
+                )
+            d = nissans_tkufa - tkufot_year_begin
+            tkufot_list = []
+            for _ in range(4):
+                d = d + tkufa_duration
+                tkufot_list.append((days_to_date(d.days), d.hours, d.minutes))
+            tkufot.append(tkufot_list)
+            nissans_tkufa_from_begining = nissans_tkufa_from_begining + sun_year
+        return tkufot
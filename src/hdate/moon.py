@@ -1,78 +1,81 @@
 from . import gematria
 from .angle import angle
 from .hdate import HDate
-from . import molad
+from .day_context import DayContext, memoize
 from . import sun
 
 import math
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class Moon:
     """
     Moon movements. Ch. 14
     """
 
+    # פרק יד הלכה ה, by the sun location. On a boundary the last range is used
+    sunset_corrections = {
+        (345, 360): angle(0),  # חצי דגים עד חצי טלה
+        (0, 15): angle(0),
+        (15, 60): angle(0, "טו"),  # חצי טלה עד תאומים
+        (60, 120): angle(0, "ל"),  # תאומים עד אריה
+        (120, 165): angle(0, "טו"),  # אריה עד חצי בתולה
+        (165, 195): angle(0),  # חצי בתולה עד חצי מאזניים
+        (195, 240): 0 - angle(0, "טו"),  # חצי מאזניים עד קשת
+        (240, 300): 0 - angle(0, "ל"),  # קשת עד דלי
+        (300, 345): 0 - angle(0, "טו"),  # דלי עד חצי דגים
+    }
+
+    # פרק טו הלכה ג, by the double distance
+    double_distance_corrections = {
+        (6, 11.5): angle(1),
+        (11.5, 18.5): angle(2),
+        (18.5, 24.5): angle(3),
+        (24.5, 31.5): angle(4),
+        (31.5, 38.5): angle(5),
+        (38.5, 45.5): angle(6),
+        (45.5, 51.5): angle(7),
+        (51.5, 59.5): angle(8),
+        (59.5, 63.5): angle(9),
+    }
+
+    # פרק טו הלכה ו, by the true path
+    true_path_corrections = {
+        0: angle(0),
+        10: angle(0, 50),
+        20: angle(1, 38),
+        30: angle(2, 24),
+        40: angle(3, 6),
+        50: angle(3, 44),
+        60: angle(4, 16),
+        70: angle(4, 41),
+        80: angle(5),
+        90: angle(5, 8),
+        100: angle(5, 8),
+        110: angle(4, 59),
+        120: angle(4, 40),
+        130: angle(4, 11),
+        140: angle(3, 33),
+        150: angle(2, 48),
+        160: angle(1, 56),
+        170: angle(0, 59),
+        180: angle(0),
+    }
+
     @staticmethod
+    @memoize
     def mean_location_on_sunset(date: HDate):
         """
         Compute the mean location of the moon during the sunset of a specific day
         אמצע הירח בשעת הראיה, פרק יד הלכה ה
         """
-        corrections = {
-            (
-                345,
-                360,
-            ): angle(
-                0
-            ),  # חצי דגים עד חצי טלה
-            (
-                0,
-                15,
-            ): angle(0),
-            (
-                15,
-                60,
-            ): angle(
-                0, "טו"
-            ),  # חצי טלה עד תאומים
-            (
-                60,
-                120,
-            ): angle(
-                0, "ל"
-            ),  # תאומים עד אריה
-            (
-                120,
-                165,
-            ): angle(
-                0, "טו"
-            ),  # אריה עד חצי בתולה
-            (
-                165,
-                195,
-            ): angle(
-                0
-            ),  # חצי בתולה עד חצי מאזניים
-            (
-                195,
-                240,
-            ): 0
-            - angle(0, "טו"),  # חצי מאזניים עד קשת
-            (
-                240,
-                300,
-            ): 0
-            - angle(0, "ל"),  # קשת עד דלי
-            (
-                300,
-                345,
-            ): 0
-            - angle(0, "טו"),  # דלי עד חצי דגים
-        }
-
         sun_location_deg = sun.Sun.location(date).as_degrees_fraction()
 
-        for (min, max), correction in corrections.items():
+        for (min, max), correction in Moon.sunset_corrections.items():
             if sun_location_deg >= min and sun_location_deg <= max:
                 sun_correction = correction
         moon_location = Moon.mean_location(date)
@@ -82,6 +85,7 @@ class Moon:
         return moon_location
 
     @staticmethod
+    @memoize
     def true_path_correction(date: HDate):
         """
         מנת המסלול הנכון, פרק ט"ו הלכה ו
@@ -93,32 +97,11 @@ class Moon:
         path = round(path.as_degrees_fraction())
         assert path <= 180.0
         assert path >= 0.0
-        correction_values = {
-            0: angle(0),
-            10: angle(0, 50),
-            20: angle(1, 38),
-            30: angle(2, 24),
-            40: angle(3, 6),
-            50: angle(3, 44),
-            60: angle(4, 16),
-            70: angle(4, 41),
-            80: angle(5),
-            90: angle(5, 8),
-            100: angle(5, 8),
-            110: angle(4, 59),
-            120: angle(4, 40),
-            130: angle(4, 11),
-            140: angle(3, 33),
-            150: angle(2, 48),
-            160: angle(1, 56),
-            170: angle(0, 59),
-            180: angle(0),
-        }
 
         floor = math.floor(path / 10) * 10
         ceil = math.ceil(path / 10) * 10
-        floor_cor = correction_values[floor]
-        ceil_cor = correction_values[ceil]
+        floor_cor = Moon.true_path_corrections[floor]
+        ceil_cor = Moon.true_path_corrections[ceil]
         if ceil_cor < floor_cor:
             correction_per_degree = (floor_cor - ceil_cor) / 10
             correction = floor_cor - correction_per_degree * (path - floor)
@@ -128,6 +111,7 @@ class Moon:
         return correction
 
     @staticmethod
+    @memoize
     def true_location(date: HDate):
         """
         מקום הירח האמיתי לשעת הראיה, פרק ט"ו הלכה ד
@@ -151,6 +135,7 @@ class Moon:
         return Moon._compute_location_on_day(date, mean_location_coefs)
 
     @staticmethod
+    @memoize
     def double_distance(date: HDate):
         """
         Compute the "doubled_distance" of the moon in a specific day
@@ -161,53 +146,16 @@ class Moon:
         return (mean_location - mean_sun_location) * 2
 
     @staticmethod
+    @memoize
     def true_path(date: HDate):
         """
         Compute the "true path" of the moon in a specific day
         המסלול הנכון, פרק ט"ו הלכה ג
         """
-        corrections = {
-            (
-                6,
-                11.5,
-            ): angle(1),
-            (
-                11.5,
-                18.5,
-            ): angle(2),
-            (
-                18.5,
-                24.5,
-            ): angle(3),
-            (
-                24.5,
-                31.5,
-            ): angle(4),
-            (
-                31.5,
-                38.5,
-            ): angle(5),
-            (
-                38.5,
-                45.5,
-            ): angle(6),
-            (
-                45.5,
-                51.5,
-            ): angle(7),
-            (
-                51.5,
-                59.5,
-            ): angle(8),
-            (
-                59.5,
-                63.5,
-            ): angle(9),
-        }
         double_distance = Moon.double_distance(date)
         mean_path = Moon.mean_path(date)
 
-        for (min, max), correction in corrections.items():
+        for (min, max), correction in Moon.double_distance_corrections.items():
             if (
                 double_distance.as_degrees_fraction() >= min
                 and double_distance.as_degrees_fraction() < max
@@ -226,10 +174,138 @@ class Moon:
 
     @staticmethod
     def _compute_location_on_day(date: HDate, coefficients):
-        days_since_t0 = molad.Months.days_diff(coefficients["t0"], date)
+        days_since_t0 = DayContext.of(date).days_since(coefficients["t0"])
         location = coefficients["x0"] + coefficients["v"] * days_since_t0
         return location.remove_circles()
 
+    @staticmethod
+    def _location_on_days_array(days, coefficients):
+        """
+        Vectorized _compute_location_on_day, in degrees
+        """
+        days_since_t0 = (
+            np.asarray(days, dtype=np.int64) - coefficients["t0"].absolute_day
+        )
+        x0 = coefficients["x0"].as_degrees_fraction()
+        v = coefficients["v"].as_degrees_fraction()
+        return (x0 + v * days_since_t0) % angle.DEGREES
+
+    @staticmethod
+    def _ranges_array(ranges, values):
+        """
+        Bounds and values arrays of a ranges table, e.g. sunset_corrections
+        """
+        bounds = np.array(list(ranges), dtype=np.float64)
+        values = [
+            value.as_degrees_fraction() if isinstance(value, angle) else value
+            for value in values
+        ]
+        return bounds[:, 0], bounds[:, 1], np.array(values)
+
+    @staticmethod
+    def mean_location_array(days):
+        """
+        Vectorized mean_location over an array of days from the beginning (1,1,1)
+        (see HDate.absolute_day), in degrees
+        """
+        return Moon._location_on_days_array(days, mean_location_coefs)
+
+    @staticmethod
+    def mean_path_array(days):
+        """
+        Vectorized mean_path, in degrees
+        """
+        return Moon._location_on_days_array(days, mean_path_coefs)
+
+    @staticmethod
+    def mean_location_on_sunset_array(days, sun_location=None):
+        """
+        Vectorized mean_location_on_sunset, in degrees
+        sun_location : Sun.location_array(days), when already computed
+        """
+        if sun_location is None:
+            sun_location = sun.Sun.location_array(days)
+        low, high, values = Moon._ranges_array(
+            Moon.sunset_corrections.keys(), Moon.sunset_corrections.values()
+        )
+        sun_location = np.asarray(sun_location)[:, np.newaxis]
+        in_range = (sun_location >= low) & (sun_location <= high)
+        # the last matching range, as in the loop of mean_location_on_sunset
+        last = len(low) - 1 - np.argmax(in_range[:, ::-1], axis=1)
+        correction = np.where(in_range.any(axis=1), values[last], np.nan)
+        return (Moon.mean_location_array(days) + correction) % angle.DEGREES
+
+    @staticmethod
+    def double_distance_array(days, mean_location_on_sunset=None):
+        """
+        Vectorized double_distance, in degrees (up to 720, as double_distance)
+        """
+        if mean_location_on_sunset is None:
+            mean_location_on_sunset = Moon.mean_location_on_sunset_array(days)
+        distance = mean_location_on_sunset - sun.Sun.mean_location_array(days)
+        return (distance % angle.DEGREES) * 2
+
+    @staticmethod
+    def true_path_array(days, double_distance=None):
+        """
+        Vectorized true_path, in degrees
+        """
+        if double_distance is None:
+            double_distance = Moon.double_distance_array(days)
+        low, high, values = Moon._ranges_array(
+            Moon.double_distance_corrections.keys(),
+            Moon.double_distance_corrections.values(),
+        )
+        double_distance = np.asarray(double_distance)[:, np.newaxis]
+        in_range = (double_distance >= low) & (double_distance < high)
+        correction = (in_range * values).sum(axis=1)
+        return (Moon.mean_path_array(days) + correction) % angle.DEGREES
+
+    @staticmethod
+    def true_path_correction_array(days, true_path=None):
+        """
+        Vectorized true_path_correction, in degrees
+        """
+        if true_path is None:
+            true_path = Moon.true_path_array(days)
+        thirds_in_degree = angle.PARTS**3
+        path = np.asarray(true_path, dtype=np.float64)
+        path = np.where(path > 180, angle.DEGREES - path, path)
+        # drop the float noise below the thirds, so that halves round as in angle
+        path = np.round(np.round(path * thirds_in_degree, 3) / thirds_in_degree)
+        values = [
+            Moon.true_path_corrections[degree].as_degrees_fraction()
+            for degree in range(0, 190, 10)
+        ]
+        values = np.array(values + values[-1:])
+        index = (path // 10).astype(np.int64)
+        return values[index] + (values[index + 1] - values[index]) / 10 * (
+            path - index * 10
+        )
+
+    @staticmethod
+    def true_location_array(days, sun_location=None):
+        """
+        Vectorized true_location over an array of days from the beginning
+        (1,1,1) (see HDate.absolute_day), in degrees within [0, 360)
+        sun_location : Sun.location_array(days), when already computed
+        פרק ט"ו הלכה ד
+
+        >>> date = HDate(2, "אייר", "ד-תתקלח")
+        >>> Moon.true_location_array([date.absolute_day]).round(6).tolist()
+        [48.597464]
+        >>> round(Moon.true_location(date).as_degrees_fraction(), 6)
+        48.597464
+        """
+        days = np.asarray(days, dtype=np.int64)
+        mean_location = Moon.mean_location_on_sunset_array(days, sun_location)
+        double_distance = Moon.double_distance_array(days, mean_location)
+        true_path = Moon.true_path_array(days, double_distance)
+        correction = Moon.true_path_correction_array(days, true_path)
+        correction = np.where(true_path < 180, -correction, correction)
+        correction = np.where(true_path == 180, 0, correction)
+        return (mean_location + correction) % angle.DEGREES
+
 
 RambamBeginningDay = HDate("ג", "ניסן", "ד-תתקלח")
 mean_location_coefs = {
@@ -0,0 +1,95 @@
+"""
+Compute a function of a date over a range of days, by a pool of processes
+
+The astronomical computations (Sun.location, Moon.true_location,
+EclipticLatitude.compute, ViewArc.compute) depend only on the date, so a range
+of days is split to chunks which are computed by worker processes, and the
+results are returned in the order of the days.
+
+The coefficients chosen by set_hazon_shamaim are module globals, so they are
+passed to each worker, and the results do not depend on the number of workers
+or on the way the processes are started.
+
+Example:
+    >>> from hdate.sun import Sun
+    >>> start = HDate(1, "ניסן", 5784)
+    >>> locations = map_days(Sun.location, start, start + 3, workers=1)
+    >>> locations == [Sun.location(start + day) for day in range(3)]
+    True
+"""
+
+import math
+import os
+import typing
+from concurrent.futures import ProcessPoolExecutor
+
+from . import ecliptic_lat
+from . import moon
+from . import sun
+from .hdate import HDate
+
+CHUNKS_PER_WORKER = 4
+
+# (module, global name) of the coefficients changed by set_hazon_shamaim
+COEFFICIENTS = (
+    (sun, "location_coefs"),
+    (sun, "aphelion_coefs"),
+    (moon, "mean_location_coefs"),
+    (moon, "mean_path_coefs"),
+    (ecliptic_lat, "moon_plane_coefs"),
+)
+
+
+def _get_coefficients():
+    return [getattr(module, name) for module, name in COEFFICIENTS]
+
+
+def _set_coefficients(values):
+    for (module, name), value in zip(COEFFICIENTS, values):
+        setattr(module, name, value)
+
+
+def _compute_chunk(job):
+    function, start, first, count = job
+    return [function(start + day) for day in range(first, first + count)]
+
+
+def map_days(
+    function: typing.Callable[[HDate], typing.Any],
+    start: HDate,
+    end: HDate,
+    workers: typing.Optional[int] = None,
+    chunk_size: typing.Optional[int] = None,
+):
+    """
+    Compute function(date) for each date in range [start, end)
+
+    function : a picklable function of a date, e.g. Sun.location
+    workers : number of processes, default: the number of CPUs.
+              1 computes in the calling process
+    chunk_size : number of days computed by a worker at once
+
+    returns : list of the results, by the order of the days
+    """
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, not {chunk_size}")
+    days = max(0, end - start)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or days <= 1:
+        return _compute_chunk((function, start, 0, days))
+
+    if chunk_size is None:
+        chunk_size = math.ceil(days / (workers * CHUNKS_PER_WORKER))
+    jobs = [
+        (function, start, first, min(chunk_size, days - first))
+        for first in range(0, days, chunk_size)
+    ]
+    results = []
+    with ProcessPoolExecutor(
+        min(workers, len(jobs)),
+        initializer=_set_coefficients,
+        initargs=(_get_coefficients(),),
+    ) as executor:
+        for chunk in executor.map(_compute_chunk, jobs):
+            results.extend(chunk)
+    return results
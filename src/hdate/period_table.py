@@ -0,0 +1,58 @@
+"""
+Table of the year pattern for each year of the full calendar period
+
+The molad of תשרי and the leap years cycle repeat every molad.YEARS_PERIOD
+years, so the pattern of every year is found at (year - 1) % YEARS_PERIOD.
+The table is stored as a byte (pattern code) per year, and loaded with mmap so
+that several processes share it without copying.
+
+Example:
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), "period.bin")
+    >>> build_period_table(path)
+    >>> table = load_period_table(path)
+    >>> molad.YEARS_PATTERNS_CODES[table[5787 - 1]]
+    'זשה'
+"""
+
+import mmap
+import struct
+
+from . import molad
+
+MAGIC = b"HDPT"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sII")  # magic, format version, period
+
+
+def build_period_table(path: str):
+    """
+    Compute the patterns of the whole period and write them to a file
+    """
+    table = molad.Months.year_table(1, molad.YEARS_PERIOD + 1)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, molad.YEARS_PERIOD))
+        f.write(table.pattern.astype("uint8").tobytes())
+
+
+def load_period_table(path: str):
+    """
+    Map a period table file to memory (read only)
+
+    returns : a memoryview of pattern codes, indexed by (year - 1)
+    """
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, period = HEADER.unpack_from(mapped)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"{path} is not a period table version {FORMAT_VERSION}")
+    if period != molad.YEARS_PERIOD or len(mapped) != HEADER.size + period:
+        raise ValueError(f"{path} does not contain a full period")
+    return memoryview(mapped)[HEADER.size :]
+
+
+def use_period_table(path: str):
+    """
+    Load a period table file and use it in molad.Months computations
+    """
+    molad.set_period_table(load_period_table(path))
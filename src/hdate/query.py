@@ -0,0 +1,203 @@
+"""
+Queries over the years of the calendar
+
+All the structure of a year (leap, year type, length and the weekday of each
+date) is determined by its pattern (see molad.YEARS_PATTERNS). Structured
+predicates are therefore compiled to the set of patterns they match, and are
+evaluated over a whole range of years at once with numpy.
+
+Example:
+    >>> passover_at_sunday = weekday_is("ניסן", 15, 1)
+    >>> find_years(passover_at_sunday, 5780, 5800)
+    [5781, 5785]
+    >>> find_years(lambda info: info.passover_weekday == 1, 5780, 5800)
+    [5781, 5785]
+"""
+
+import typing
+
+from . import gematria
+from . import molad
+from .leap_years import leapYear
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PATTERNS_CODES = {
+    pattern: code for code, pattern in enumerate(molad.YEARS_PATTERNS_CODES)
+}
+
+
+class YearPredicate(object):
+    """
+    A predicate over years, by the codes of the patterns it matches
+    (see molad.YEARS_PATTERNS_CODES). Combine with &, | and ~
+
+    >>> leap() & year_type_is(molad.YearType.FULL)
+    YearPredicate('בשז', 'השג', 'זשה')
+    """
+
+    __slots__ = ("codes",)
+
+    def __init__(self, codes: typing.Iterable[int]):
+        self.codes = frozenset(codes)
+
+    def __call__(self, info: molad.YearInfo):
+        return PATTERNS_CODES[info.pattern] in self.codes
+
+    def __and__(self, other: "YearPredicate"):
+        return YearPredicate(self.codes & other.codes)
+
+    def __or__(self, other: "YearPredicate"):
+        return YearPredicate(self.codes | other.codes)
+
+    def __invert__(self):
+        return YearPredicate(set(PATTERNS_CODES.values()) - self.codes)
+
+    def __repr__(self):
+        patterns = ", ".join(
+            repr(molad.YEARS_PATTERNS_CODES[c]) for c in sorted(self.codes)
+        )
+        return f"YearPredicate({patterns})"
+
+
+def _patterns_where(condition):
+    return YearPredicate(
+        code
+        for code, (pattern, year_type, days) in enumerate(
+            molad.YEARS_PATTERNS_CODES_INFO
+        )
+        if condition(pattern, year_type, days)
+    )
+
+
+def pattern_is(*patterns: str):
+    """
+    Years of one of the patterns
+
+    >>> pattern_is("בחג", "זשה")
+    YearPredicate('בחג', 'זשה')
+    """
+    for pattern in patterns:
+        if pattern not in molad.YEARS_PATTERNS:
+            raise ValueError(f"{pattern} is not a year pattern")
+    return _patterns_where(lambda pattern, year_type, days: pattern in patterns)
+
+
+def leap(is_leap: bool = True):
+    """
+    Leap years (or non leap years)
+    """
+    return _patterns_where(
+        lambda pattern, year_type, days: (pattern in molad.YEARS_PATTERNS_LEAP)
+        == is_leap
+    )
+
+
+def year_type_is(year_type: molad.YearType):
+    """
+    Years of a year type (חסרה, כסדרה, שלמה)
+    """
+    return _patterns_where(lambda pattern, t, days: t == year_type)
+
+
+def days_is(*days_count: int):
+    """
+    Years of one of the lengths in days
+
+    >>> days_is(353, 383)
+    YearPredicate('בחג', 'זחא', 'בחה', 'החא', 'זחג')
+    """
+    return _patterns_where(lambda pattern, year_type, days: days in days_count)
+
+
+def weekday_is(
+    month: typing.Union[int, str], month_day: typing.Union[int, str], *weekdays: int
+):
+    """
+    Years in which a date falls on one of the weekdays, Sunday is 1
+    Years without such a date (e.g. אדר א' in a non leap year) never match
+
+    >>> weekday_is("תשרי", 1, 1, 4, 6)
+    YearPredicate()
+    """
+    month_day = gematria.str_to_num(month_day)
+
+    def condition(pattern, year_type, days):
+        is_leap = pattern in molad.YEARS_PATTERNS_LEAP
+        try:
+            month_num = gematria.month_to_num(is_leap, month)
+        except ValueError:
+            return False
+        months_length = molad._months_length(is_leap, year_type)
+        if not 1 <= month_num <= len(months_length):
+            return False
+        if not 1 <= month_day <= months_length[month_num - 1]:
+            return False
+        day_of_year = molad.MONTHS_BEGIN[is_leap, year_type][month_num - 1]
+        return molad.WEEKDAYS_INDEX[pattern][day_of_year + month_day - 1] in weekdays
+
+    return _patterns_where(condition)
+
+
+def patterns_array(years):
+    """
+    Pattern codes of an increasing array of years, from the period table when
+    it is loaded (see hdate.period_table)
+    """
+    if molad.period_table is not None and (len(years) == 0 or years[0] >= 1):
+        codes = np.frombuffer(molad.period_table, dtype=np.uint8)
+        return codes[(years - 1) % molad.YEARS_PERIOD].astype(np.int8)
+    if len(years) == 0:
+        return np.zeros(0, dtype=np.int8)
+    table = molad.Months.year_table(int(years[0]), int(years[-1]) + 1)
+    return table.pattern[years - years[0]]
+
+
+def years_mask(predicate: YearPredicate, patterns):
+    """
+    Vectorized predicate over an array of pattern codes (see patterns_array
+    and Months.year_table)
+
+    >>> table = molad.Months.year_table(5780, 5786)
+    >>> years_mask(leap(), table.pattern).tolist()
+    [False, False, True, False, True, False]
+    """
+    return np.isin(patterns, sorted(predicate.codes))
+
+
+def find_years(
+    predicate: typing.Callable[[molad.YearInfo], bool],
+    start: typing.Union[int, str],
+    end: typing.Union[int, str],
+):
+    """
+    Find the years in range [start, end) that match a predicate
+
+    A YearPredicate is evaluated over the whole range at once. Any other
+    callable is called with the (cached) Months.year_info of each year.
+    """
+    start = gematria.year_to_num(start)
+    end = max(start, gematria.year_to_num(end))
+    if not isinstance(predicate, YearPredicate):
+        return [
+            year
+            for year in range(start, end)
+            if predicate(molad.Months.year_info(year))
+        ]
+
+    if not predicate.codes:
+        return []
+    years = np.arange(start, end, dtype=np.int64)
+    leaps = {
+        molad.YEARS_PATTERNS_CODES[code] in molad.YEARS_PATTERNS_LEAP
+        for code in predicate.codes
+    }
+    if len(leaps) == 1:
+        # only leap (or only non leap) years can match, skip the others by the
+        # 19 years cycle
+        is_leap = np.array(leapYear.IS_LEAP)[(years - 1) % leapYear.CYCLE]
+        years = years[is_leap == leaps.pop()]
+    return years[years_mask(predicate, patterns_array(years))].tolist()
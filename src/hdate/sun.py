@@ -7,9 +7,14 @@ import typing
 from . import gematria
 from .angle import angle
 from .hdate import HDate
-from . import molad
+from .day_context import DayContext, memoize
 import math
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class Sun:
     """
@@ -42,11 +47,12 @@ class Sun:
 
     @staticmethod
     def _compute_location_on_day(date: HDate, coefficients):
-        days_since_t0 = molad.Months.days_diff(coefficients["t0"], date)
+        days_since_t0 = DayContext.of(date).days_since(coefficients["t0"])
         location = coefficients["x0"] + coefficients["v"] * days_since_t0
         return location.remove_circles()
 
     @staticmethod
+    @memoize
     def location(date: HDate, correction_func=None):
         """
         Compute the location of the sun in a specific day (ecliptic long of the sun)
@@ -81,6 +87,29 @@ class Sun:
 
         return -correction_deg
 
+    # פרק יג הלכה ד
+    rambam_corrections = {
+        0: angle(0),
+        10: angle(0, 20),
+        20: angle(0, 40),
+        30: angle(0, 58),
+        40: angle(1, 15),
+        50: angle(1, 29),
+        60: angle(1, 41),
+        70: angle(1, 51),
+        80: angle(1, 57),
+        90: angle(1, 59),
+        100: angle(1, 58),
+        110: angle(1, 53),
+        120: angle(1, 45),
+        130: angle(1, 33),
+        140: angle(1, 19),
+        150: angle(1, 1),
+        160: angle(0, 42),
+        170: angle(0, 21),
+        180: angle(0),
+    }
+
     @staticmethod
     def rambam_correction(path):
         """
@@ -95,38 +124,97 @@ class Sun:
         path = round(path.as_degrees_fraction())
         assert path <= 180.0
         assert path >= 0.0
-        correction_values = {
-            0: angle(0),
-            10: angle(0, 20),
-            20: angle(0, 40),
-            30: angle(0, 58),
-            40: angle(1, 15),
-            50: angle(1, 29),
-            60: angle(1, 41),
-            70: angle(1, 51),
-            80: angle(1, 57),
-            90: angle(1, 59),
-            100: angle(1, 58),
-            110: angle(1, 53),
-            120: angle(1, 45),
-            130: angle(1, 33),
-            140: angle(1, 19),
-            150: angle(1, 1),
-            160: angle(0, 42),
-            170: angle(0, 21),
-            180: angle(0),
-        }
 
         floor = math.floor(path / 10) * 10
         ceil = math.ceil(path / 10) * 10
-        floor_cor = correction_values[floor].as_degrees_fraction()
-        ceil_cor = correction_values[ceil].as_degrees_fraction()
+        floor_cor = Sun.rambam_corrections[floor].as_degrees_fraction()
+        ceil_cor = Sun.rambam_corrections[ceil].as_degrees_fraction()
         correction_per_degree = (ceil_cor - floor_cor) / 10
         correction = floor_cor + correction_per_degree * (path - floor)
         if inv:
             correction = -correction
         return correction
 
+    @staticmethod
+    def _location_on_days_array(days, coefficients):
+        """
+        Vectorized _compute_location_on_day, in degrees
+        """
+        days_since_t0 = (
+            np.asarray(days, dtype=np.int64) - coefficients["t0"].absolute_day
+        )
+        x0 = coefficients["x0"].as_degrees_fraction()
+        v = coefficients["v"].as_degrees_fraction()
+        return (x0 + v * days_since_t0) % angle.DEGREES
+
+    @staticmethod
+    def mean_location_array(days):
+        """
+        Vectorized mean_location over an array of days from the beginning (1,1,1)
+        (see HDate.absolute_day), in degrees
+        """
+        return Sun._location_on_days_array(days, location_coefs)
+
+    @staticmethod
+    def aphelion_array(days):
+        """
+        Vectorized aphelion over an array of days from the beginning (1,1,1)
+        (see HDate.absolute_day), in degrees
+        """
+        return Sun._location_on_days_array(days, aphelion_coefs)
+
+    @staticmethod
+    def rambam_correction_array(path):
+        """
+        Vectorized rambam_correction over an array of paths in degrees
+        פרק יג הלכה ד-ח
+
+        >>> Sun.rambam_correction_array([45, 315]).round(4).tolist()
+        [1.3667, -1.3667]
+        """
+        thirds_in_degree = angle.PARTS**3
+        path = np.asarray(path, dtype=np.float64) % angle.DEGREES
+        # drop the float noise below the thirds, so that halves round as in angle
+        path = np.round(path * thirds_in_degree, 3) / thirds_in_degree
+        inv = path > 180
+        path = np.round(np.where(inv, angle.DEGREES - path, path))
+        values = [
+            Sun.rambam_corrections[d].as_degrees_fraction() for d in range(0, 190, 10)
+        ]
+        values = np.array(values + values[-1:])
+        index = (path // 10).astype(np.int64)
+        correction = values[index] + (values[index + 1] - values[index]) / 10 * (
+            path - index * 10
+        )
+        return np.where(inv, -correction, correction)
+
+    @staticmethod
+    def location_array(days, thirds: bool = False):
+        """
+        Vectorized location over an array of days from the beginning (1,1,1)
+        (see HDate.absolute_day and Months.absolute_day_array)
+        פרק יג הלכה א
+
+        returns : degrees, or integer thirds (שלישיות) when thirds is True
+
+        >>> day = HDate(2, "אייר", "ד-תתקלח").absolute_day
+        >>> Sun.location_array([day]).round(6).tolist()
+        [37.145992]
+        >>> round(Sun.location(HDate(2, "אייר", "ד-תתקלח")).as_degrees_fraction(), 6)
+        37.145992
+        """
+        mean_location = Sun.mean_location_array(days)
+        sun_path = Sun.aphelion_array(days) - mean_location
+        location = (
+            mean_location + Sun.rambam_correction_array(sun_path)
+        ) % angle.DEGREES
+        if thirds:
+            thirds_in_degree = angle.PARTS**3
+            return np.round(location * thirds_in_degree).astype(np.int64) % (
+                angle.THIRDS_IN_CIRCLE
+            )
+        return location
+
 
 RambamBeginningDay = HDate("ג", "ניסן", "ד-תתקלח")
 location_coefs = {
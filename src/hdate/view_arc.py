@@ -1,6 +1,7 @@
 from hdate import gematria
 from hdate.angle import angle
 from hdate.hdate import HDate
+from hdate.day_context import DayContext
 from hdate import molad
 from hdate import sun
 from hdate import moon
@@ -8,6 +9,11 @@ from hdate import ecliptic_lat
 
 import math
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class ViewArc:
     """
@@ -17,6 +23,7 @@ class ViewArc:
 
     @staticmethod
     def is_seen(date: HDate) -> bool:
+        date = DayContext.of(date)
         sun_location = sun.Sun.location(date).as_degrees_fraction()
         moon_location = moon.Moon.true_location(date).as_degrees_fraction()
         first_length = moon_location - sun_location  # הלכה א
@@ -43,6 +50,7 @@ class ViewArc:
         """
         פרק יז
         """
+        date = DayContext.of(date)
         sun_location = sun.Sun.location(date).as_degrees_fraction()
         moon_location = moon.Moon.true_location(date).as_degrees_fraction()
         is_south, latitude = ecliptic_lat.EclipticLatitude.compute(date)  # רוחב הירח
@@ -218,3 +226,116 @@ class ViewArc:
         """
 
         return third_lon * ViewArc.lon_4th_correction[moon_location // 30 * 30]
+
+    @staticmethod
+    def _by_mazal_array(table):
+        """
+        Array of the values of a table by mazal (e.g. lon_correction), in degrees
+        """
+        return np.array(
+            [
+                value.as_degrees_fraction() if isinstance(value, angle) else value
+                for _, value in sorted(table.items())
+            ]
+        )
+
+    @staticmethod
+    def _locations_array(days, sun_location=None, moon_location=None):
+        days = np.asarray(days, dtype=np.int64)
+        if sun_location is None:
+            sun_location = sun.Sun.location_array(days)
+        if moon_location is None:
+            moon_location = moon.Moon.true_location_array(days, sun_location)
+        return days, sun_location, moon_location
+
+    @staticmethod
+    def is_seen_array(days, sun_location=None, moon_location=None):
+        """
+        Vectorized is_seen over an array of evenings, as days from the beginning
+        (1,1,1) (see HDate.absolute_day)
+        sun_location, moon_location : Sun.location_array(days) and
+                                      Moon.true_location_array(days), when
+                                      already computed
+
+        returns : array of 1 (seen), 0 (not seen) and -1 (not decided by the
+                  first length, as None of is_seen)
+
+        >>> date = HDate(2, "אייר", "ד-תתקלח")
+        >>> ViewArc.is_seen_array([date.absolute_day, (date + 1).absolute_day])
+        array([-1,  1], dtype=int8)
+        """
+        _, sun_location, moon_location = ViewArc._locations_array(
+            days, sun_location, moon_location
+        )
+        first_length = moon_location - sun_location  # הלכה א
+
+        # הלכה ג
+        moon_between_cancer_and_twins = (
+            moon_location > gematria.mazal_to_degree("סרטן")
+        ) & (moon_location < gematria.mazal_to_degree("קשת") + 30)
+        not_seen = np.where(moon_between_cancer_and_twins, 10, 9)
+        seen = np.where(moon_between_cancer_and_twins, 24, 15)
+        result = np.full(first_length.shape, -1, dtype=np.int8)
+        result[first_length > seen] = 1
+        result[first_length <= not_seen] = 0
+        return result
+
+    @staticmethod
+    def compute_array(days, sun_location=None, moon_location=None):
+        """
+        Vectorized compute over an array of evenings, as days from the beginning
+        (1,1,1) (see HDate.absolute_day), in degrees
+        sun_location, moon_location : as of is_seen_array
+
+        Unlike compute, the moon location is within [0, 360), so it does not
+        fail where Moon.true_location reaches 360.
+
+        >>> date = HDate(2, "אייר", "ד-תתקלח")
+        >>> ViewArc.compute_array([date.absolute_day]).round(6).tolist()
+        [11.167878]
+        """
+        days, sun_location, moon_location = ViewArc._locations_array(
+            days, sun_location, moon_location
+        )
+        is_south, latitude = ecliptic_lat.EclipticLatitude.compute_array(
+            days, moon_location
+        )
+        first_length = moon_location - sun_location  # הלכה א
+        mazal = (moon_location // 30).astype(np.int64)
+
+        # הלכה ה, angles are within [0, 360)
+        second_length = (
+            first_length - ViewArc._by_mazal_array(ViewArc.lon_correction)[mazal]
+        )
+        second_length = np.where(second_length < 0, second_length + 360, second_length)
+        second_lat = latitude + ViewArc._by_mazal_array(ViewArc.lat_correction)[mazal]
+
+        # הלכה י
+        max_degrees = [
+            max_degree.as_degrees_fraction()
+            for max_degree, _ in ViewArc.circle_corrections[:-1]
+        ]
+        corrections = np.array(
+            [correction for _, correction in ViewArc.circle_corrections]
+        )
+        moon_circle = (
+            second_lat
+            * corrections[np.searchsorted(max_degrees, moon_location, side="right")]
+        )
+        subtract = (mazal >= 3) & (mazal <= 8)  # from סרטן to קשת
+        third_length = np.where(
+            subtract, second_length - moon_circle, second_length + moon_circle
+        )
+        third_length = np.where(third_length < 0, third_length + 360, third_length)
+
+        # הלכה יב
+        forth_length = (
+            third_length * ViewArc._by_mazal_array(ViewArc.lon_4th_correction)[mazal]
+        )
+        world_lat = 2 / 3  # jerusalem - 32 lat
+        view_arc = np.where(
+            is_south,
+            forth_length - latitude * world_lat,
+            forth_length + latitude * world_lat,
+        )
+        return np.where(view_arc < 0, view_arc + 360, view_arc)
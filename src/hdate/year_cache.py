@@ -0,0 +1,177 @@
+"""
+Cache file of the computed data of a range of years (see molad.YearTable)
+
+The years are stored as fixed width little endian records after a small
+header, and are loaded with mmap so that several processes share them without
+copying or computing. The header holds a stamp of the calendar rules and of
+the package version, so a file is only used by the code that wrote it. The
+format does not depend on the machine, so a file can also be prebuilt and
+shipped as package data.
+
+Set the environment variable HDATE_YEAR_CACHE to the path of a cache file to
+use it from the import of hdate. The file is built there when it is missing or
+was built by another version. It can also be prebuilt with
+    python -m hdate.year_cache PATH [START END]
+
+Example:
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), "years.bin")
+    >>> build_year_cache(path, 5000, 6000)
+    >>> table = load_year_cache(path)
+    >>> int(table.days[5787 - 5000]), int(table.weekday[5787 - 5000])
+    (385, 7)
+"""
+
+import hashlib
+import os
+import struct
+import sys
+import warnings
+
+from . import molad
+from .leap_years import leapYear
+
+try:
+    from importlib import metadata
+except ImportError:
+    metadata = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+ENVIRONMENT_VARIABLE = "HDATE_YEAR_CACHE"
+
+MAGIC = b"HDYC"
+FORMAT_VERSION = 1
+# magic, format version, record size, stamp, first year, years count
+HEADER = struct.Struct("<4sII32sqq")
+
+RECORD = (
+    np.dtype(
+        [
+            ("year", "<i8"),
+            ("is_leap", "?"),
+            ("weekday", "i1"),
+            ("postpones", "?", (4,)),
+            ("year_type", "i1"),
+            ("pattern", "i1"),
+            ("days", "<i2"),
+            ("elapsed_days", "<i8"),
+        ]
+    )
+    if np is not None
+    else None
+)
+
+
+def package_version():
+    """
+    Version of the installed hdate package, "unknown" when running from source
+    """
+    try:
+        return metadata.version("hdate")
+    except Exception:
+        return "unknown"
+
+
+def rules_stamp():
+    """
+    Digest of the calendar rules constants and of the package version
+    """
+    rules = (
+        molad.PARTS_PER_DAY,
+        molad.SINODAL_MONTH_PARTS,
+        molad.FIRST_MONTH_PARTS,
+        tuple(leapYear.IS_LEAP),
+        tuple(molad.YEARS_PATTERNS_CODES),
+        package_version(),
+    )
+    return hashlib.sha256(repr(rules).encode()).digest()
+
+
+def build_year_cache(path: str, start: int = 1, end: int = 7000):
+    """
+    Compute the data of the years in range [start, end) and write it to a file
+    """
+    table = molad.Months.year_table(start, end)
+    records = np.zeros(len(table.year), dtype=RECORD)
+    for field in RECORD.names:
+        records[field] = getattr(table, field)
+    # write to a temporary file and rename, so other processes never see a
+    # partial file
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as f:
+            f.write(
+                HEADER.pack(
+                    MAGIC,
+                    FORMAT_VERSION,
+                    RECORD.itemsize,
+                    rules_stamp(),
+                    start,
+                    len(records),
+                )
+            )
+            f.write(records.tobytes())
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def load_year_cache(path: str):
+    """
+    Map a year cache file to memory (read only)
+
+    returns : a molad.YearTable whose columns are views of the file
+    """
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+    if len(header) != HEADER.size:
+        raise ValueError(f"{path} is not a year cache")
+    magic, version, record_size, stamp, start, count = HEADER.unpack(header)
+    if magic != MAGIC or version != FORMAT_VERSION or record_size != RECORD.itemsize:
+        raise ValueError(f"{path} is not a year cache version {FORMAT_VERSION}")
+    if stamp != rules_stamp():
+        raise ValueError(f"{path} was built by another version of hdate")
+    records = np.memmap(path, dtype=RECORD, mode="r", offset=HEADER.size)
+    if len(records) != count or (count and records["year"][0] != start):
+        raise ValueError(f"{path} is truncated")
+    # plain arrays over the mapped memory, indexing a memmap is much slower
+    records = records.view(np.ndarray)
+    return molad.YearTable(*(records[field] for field in molad.YearTable._fields))
+
+
+def use_year_cache(path: str):
+    """
+    Load a year cache file and use it in molad.Months computations
+    """
+    molad.set_year_cache(load_year_cache(path))
+
+
+def use_year_cache_from_environment():
+    """
+    Use the year cache file of HDATE_YEAR_CACHE, building it when it is missing
+    or was built by another version. Warns and continues without the cache when
+    it can not be built.
+    """
+    path = os.environ.get(ENVIRONMENT_VARIABLE)
+    if not path:
+        return
+    if np is None:
+        warnings.warn(f"hdate: not using the year cache {path}: numpy is missing")
+        return
+    try:
+        try:
+            use_year_cache(path)
+        except (OSError, ValueError):
+            build_year_cache(path)
+            use_year_cache(path)
+    except (OSError, ValueError) as e:
+        warnings.warn(f"hdate: not using the year cache {path}: {e}")
+
+
+if __name__ == "__main__":
+    build_year_cache(sys.argv[1], *(int(year) for year in sys.argv[2:4]))
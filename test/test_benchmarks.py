@@ -0,0 +1,22 @@
+from benchmarks import runner
+from benchmarks.scenarios import SCENARIOS
+
+
+def test_scenarios_run():
+    for function in SCENARIOS.values():
+        function()
+
+
+def test_compare(tmp_path):
+    results = runner.run(["HDate(numbers)", "Months.days_diff"], repeat=1)
+    assert all(result.calls_per_second > 0 for result in results.values())
+    path = str(tmp_path / "baseline.json")
+    runner.save(results, path)
+    baseline = runner.load(path)
+    assert baseline == results
+    faster = {
+        name: result._replace(calls_per_second=result.calls_per_second * 2)
+        for name, result in results.items()
+    }
+    assert runner.compare(results, baseline, 0.2) == {}
+    assert set(runner.compare(results, faster, 0.2)) == set(results)
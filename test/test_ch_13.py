@@ -44,3 +44,18 @@ def test_halacha_9_10():
     mazal, angle_in_mazal = location.to_mazal()
     assert mazal == "סרטן"
     assert angle_in_mazal == (angle("טו") - angle(0, 0, "לה"))
+
+
+def test_location_array():
+    start = HDate(1, 1, 5600)
+    dates = [start + day for day in range(0, 40000, 11)]
+    days = [date.absolute_day for date in dates]
+    degrees = sun.Sun.location_array(days)
+    thirds = sun.Sun.location_array(days, thirds=True)
+    for date, location_degrees, location_thirds in zip(dates, degrees, thirds):
+        location = sun.Sun.location(date)
+        assert location_degrees == pytest.approx(location.as_degrees_fraction())
+        location_thirds_scalar = (
+            (location.degrees * 60 + location.parts) * 60 + location.seconds
+        ) * 60 + location.thirds
+        assert abs(location_thirds - location_thirds_scalar) < 1
@@ -169,7 +169,11 @@ def truth_molad(month, year):
     hours_to_no_distance = diff1 / distance_moon_sun_per_hour
 
     # so, the molad is at the_day+18+hours_to_no_distance
-    day_before._month_day += hours_to_no_distance // 24
+    day_before = HDate(
+        day_before._month_day + int(hours_to_no_distance // 24),
+        day_before._month,
+        day_before._year,
+    )
     hours_to_no_distance = hours_to_no_distance % 24
     hours = hours_to_no_distance + 18
     if hours > 24:
@@ -207,3 +211,13 @@ def test_truth_molad():
                 diff = 24 - diff
 
             assert diff <= 3
+
+
+def test_true_location_array():
+    start = HDate(1, 1, 5600)
+    dates = [start + day for day in range(0, 40000, 11)]
+    locations = moon.Moon.true_location_array([date.absolute_day for date in dates])
+    for date, location in zip(dates, locations):
+        scalar = moon.Moon.true_location(date)
+        difference = (location - scalar.as_degrees_fraction()) % 360
+        assert min(difference, 360 - difference) == pytest.approx(0, abs=1e-9)
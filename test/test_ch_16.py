@@ -69,3 +69,14 @@ def test_sun_moon_velocity():
         lat0 = calc_moon_latitude(d0)
         lat1 = calc_moon_latitude_ephem(d0)
         assert abs(lat0 - lat1) < 0.5
+
+
+def test_compute_array():
+    start = HDate(1, 1, 5600)
+    dates = [start + day for day in range(0, 40000, 11)]
+    days = [date.absolute_day for date in dates]
+    is_south, latitude = ecliptic_lat.EclipticLatitude.compute_array(days)
+    for date, south, lat in zip(dates, is_south, latitude):
+        scalar_south, scalar_lat = ecliptic_lat.EclipticLatitude.compute(date)
+        assert south == scalar_south
+        assert lat == pytest.approx(scalar_lat.as_degrees_fraction())
@@ -23,3 +23,18 @@ def test_halacha_1_approx():
     view_arc_val = view_arc.ViewArc.compute(the_day)
     view_arc_val.round_to_parts()
     assert view_arc_val == angle("יא", "י")
+
+
+def test_compute_array():
+    start = HDate(1, 1, 5600)
+    dates = [start + day for day in range(0, 40000, 29)]
+    days = [date.absolute_day for date in dates]
+    arcs = view_arc.ViewArc.compute_array(days)
+    seen = view_arc.ViewArc.is_seen_array(days)
+    for date, arc, is_seen in zip(dates, arcs, seen):
+        try:
+            scalar = view_arc.ViewArc.compute(date)
+        except KeyError:  # Moon.true_location reached 360
+            continue
+        assert arc == pytest.approx(scalar.as_degrees_fraction())
+        assert is_seen == {True: 1, False: 0, None: -1}[view_arc.ViewArc.is_seen(date)]
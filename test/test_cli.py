@@ -0,0 +1,110 @@
+import csv
+import json
+import subprocess
+import sys
+
+from hdate import molad
+from hdate.cli import main
+from hdate.hdate import HDate
+from hdate.molad import Months
+
+import numpy as np
+import pytest
+
+
+def test_gregorian_to_hebrew(tmp_path):
+    dates = np.arange("1990-01-01", "2030-01-01", 37, dtype="datetime64[D]")
+    input_path = tmp_path / "dates.csv"
+    input_path.write_text("date\n" + "\n".join(dates.astype(str)) + "\n")
+    output_path = tmp_path / "out.csv"
+    assert (
+        main(
+            [
+                str(input_path),
+                "-o",
+                str(output_path),
+                "--skip-header",
+                "--batch-size",
+                "7",
+            ]
+        )
+        == 0
+    )
+    with open(output_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == len(dates)
+    for row in rows:
+        year, month, day = (int(x) for x in row["hebrew"].split("-"))
+        hdate = HDate(day, month, year)
+        assert str(molad.to_georgian(hdate)) == row["gregorian"] == row["date"]
+        assert int(row["weekday"]) == Months.weekday(hdate)
+        assert row["pattern"] == Months.year_pattern(year)
+        molad_day = Months.molad_day(year, month)
+        assert int(row["molad_weekday"]) == molad_day.days
+        assert int(row["molad_hours"]) == molad_day.hours
+        assert int(row["molad_parts"]) == molad_day.parts
+
+
+def test_hebrew_jsonl_workers(tmp_path, capsys):
+    input_path = tmp_path / "dates.jsonl"
+    lines = [json.dumps({"date": f"{year}-07-15"}) for year in range(5700, 5800)]
+    lines.append(json.dumps("כו אדר ה'תשפג"))
+    input_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    main([str(input_path), "--calendar", "hebrew", "--input-format", "jsonl"])
+    single = capsys.readouterr().out
+    main(
+        [
+            str(input_path),
+            "--calendar",
+            "hebrew",
+            "--input-format",
+            "jsonl",
+            "--batch-size",
+            "10",
+            "--workers",
+            "2",
+        ]
+    )
+    assert capsys.readouterr().out == single
+    records = [json.loads(line) for line in single.splitlines()]
+    assert len(records) == len(lines)
+    assert records[-1]["gregorian"] == "2023-03-19"
+
+
+@pytest.mark.parametrize(
+    "value", ["5783-13-01", "5783-01-45", "5783-00-10", "5783-15-01", "5784-02-30"]
+)
+def test_invalid_hebrew_dates(tmp_path, capsys, value):
+    input_path = tmp_path / "dates.csv"
+    input_path.write_text(f"5783-06-26\n{value}\n")
+    with pytest.raises(SystemExit) as exit_info:
+        main([str(input_path), "--calendar", "hebrew"])
+    assert exit_info.value.code == 1
+    assert f"{value} is not a hebrew date" in capsys.readouterr().err
+
+
+def test_module_main(tmp_path):
+    input_path = tmp_path / "dates.csv"
+    input_path.write_text("2023-03-19\n")
+    output = subprocess.run(
+        [sys.executable, "-m", "hdate.cli", str(input_path)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert output.splitlines()[1].startswith("2023-03-19,2023-03-19,5783-06-26,")
+
+
+def test_standard_streams():
+    dates = np.arange("2000-01-01", "2001-01-01", dtype="datetime64[D]").astype(str)
+    output = subprocess.run(
+        [sys.executable, "-m", "hdate.cli", "--output-format", "jsonl"],
+        input="\n".join(dates) + "\n",
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        check=True,
+    ).stdout
+    records = [json.loads(line) for line in output.splitlines()]
+    assert [record["gregorian"] for record in records] == list(dates)
+    assert records[0]["hebrew"] == "5760-04-23"
@@ -0,0 +1,34 @@
+from hdate.angle import angle
+from hdate.day_context import DayContext
+from hdate.ecliptic_lat import EclipticLatitude
+from hdate.hdate import HDate
+from hdate.moon import Moon
+from hdate.sun import Sun
+from hdate.view_arc import ViewArc
+
+
+def test_memoized_results():
+    date = HDate(2, "אייר", "ד-תתקלח")
+    context = DayContext(date)
+    view_arc = ViewArc.compute(context)
+    assert view_arc == ViewArc.compute(date)
+    assert {"Sun.location", "Moon.true_location", "EclipticLatitude.compute"} <= set(
+        context.results
+    )
+
+    moon_location = Moon.true_location(context)
+    assert moon_location == Moon.true_location(date)
+    moon_location.round_to_parts()
+    moon_location += angle(10)
+    assert Moon.true_location(context) == Moon.true_location(date)
+
+    is_south, latitude = EclipticLatitude.compute(context)
+    latitude.remove_seconds()
+    assert EclipticLatitude.compute(context) == EclipticLatitude.compute(date)
+
+
+def test_not_memoized_with_arguments():
+    context = DayContext(HDate(2, "אייר", "ד-תתקלח"))
+    location = Sun.location(context)
+    assert Sun.location(context, Sun.correction) != location
+    assert Sun.location(context) == location
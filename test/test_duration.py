@@ -0,0 +1,47 @@
+from hdate.duration import duration, sinodal_month
+
+import pytest
+
+
+def test_negative_durations():
+    negative = duration(-3, -4, -5, -6)
+    assert (negative.days, negative.hours, negative.parts, negative.moments) == (
+        -3,
+        -4,
+        -5,
+        -6,
+    )
+    assert negative + duration(3, 4, 5, 6) == duration()
+    assert duration(1) - duration(2, 3) == duration(-1, -3)
+    assert duration(0, -1).as_parts() == -1080
+    assert duration(-1, -2).as_days_fraction() == pytest.approx(-1 - 2 / 24)
+
+
+def test_trim_weeks():
+    assert duration(15, 2).trim_weeks() == duration(1, 2)
+    # 6 days less 2 hours, normalized
+    trimmed = duration(-1, -2).trim_weeks()
+    assert trimmed == duration(5, 22)
+    assert trimmed.as_days_fraction() == pytest.approx(6 - 2 / 24)
+
+
+def test_setters():
+    d = duration(1, 2, 3)
+    d.days = 8
+    d.hours = 5
+    d.parts = 7
+    assert d == duration(8, 5, 7)
+    # the value is kept and normalized
+    d = duration(1, 2, 3)
+    d.days = -2
+    assert d == duration(-1, -21, -1077)
+    assert d.as_days_fraction() == pytest.approx(-2 + (2 + 3 / 1080) / 24)
+
+
+def test_float_multiplication():
+    assert sinodal_month * 0.5 == duration(14, 18, 396, 38)
+    # rounded to the nearest moment
+    assert sinodal_month * (1 / 3) == duration(9, 20, 264, 25)
+    assert duration(0, 0, 1) * 0.3 == duration(0, 0, 0, 23)
+    assert 2.5 * duration(1) == duration(2, 12)
+    assert (duration(0, 0, 1) * 0.3).moments == 23
@@ -1,7 +1,18 @@
 from hdate.hdate import HDate
-from hdate.molad import Months, to_georgian, to_georgian_BC, from_georgian
+from hdate.molad import (
+    Months,
+    to_georgian,
+    to_georgian_BC,
+    from_georgian,
+    to_georgian_array,
+    from_georgian_array,
+    unpack_dates,
+)
 from datetime import date
+import pickle
 import ephem
+import numpy as np
+import pytest
 
 
 def test_to_georgian_BC():
@@ -54,3 +65,78 @@ def test_hebrew_vs_georgian():
     h_diff = Months.days_diff(h_rosh, h_today)
     g_diff = (g_today - g_rosh).days
     assert h_diff == g_diff
+
+
+def test_georgian_arrays():
+    gdates = np.arange(
+        np.datetime64("1900-01-01"),
+        np.datetime64("2100-01-01"),
+        37,
+        dtype="datetime64[D]",
+    )
+    packed = from_georgian_array(gdates)
+    for gdate, hdate in zip(gdates[::10].tolist(), packed[::10]):
+        year, month, day = unpack_dates(int(hdate))
+        assert from_georgian(gdate) == HDate(day, month, year)
+    assert (to_georgian_array(packed) == gdates).all()
+    ordinals = [gdate.toordinal() for gdate in gdates.tolist()]
+    assert (from_georgian_array(ordinals) == packed).all()
+
+
+@pytest.mark.parametrize(
+    "packed",
+    [
+        57831301,  # 5783 is not a leap year
+        57830145,
+        57830010,
+        57831501,
+        57840230,  # חשון of 5784 has 29 days
+        57830100,
+    ],
+)
+def test_georgian_arrays_invalid_dates(packed):
+    with pytest.raises(ValueError):
+        Months.absolute_day_array([packed])
+    with pytest.raises(ValueError):
+        to_georgian_array(np.array([57830626, packed]))
+
+
+def test_hdate_immutable():
+    date = HDate(26, 6, 5783)
+    with pytest.raises(AttributeError):
+        date._month_day = 27
+    assert Months.date_add_days_o_n_(date, 40) == HDate(7, 8, 5783)
+    assert date == HDate(26, 6, 5783)
+    assert pickle.loads(pickle.dumps(date)) == date
+
+
+def test_hdate_arithmetic():
+    begin = HDate(1, 1, 5700)
+    dates = [begin + days for days in range(0, 3000, 7)]
+    for days, date in zip(range(0, 3000, 7), dates):
+        assert date == Months.date_add_days_o_n_(begin, days)
+        assert date - begin == days
+        assert date - days == begin
+    assert sorted(reversed(dates)) == dates
+    assert max(dates) == dates[-1]
+    assert len(set(dates + dates)) == len(dates)
+
+
+def test_hdate_compare_other_types():
+    date = HDate(1, 1, 5783)
+    assert date != None
+    assert not date == (1, 1, 5783)
+    assert date in [None, "1-1-5783", date]
+    with pytest.raises(TypeError):
+        date < None
+
+
+def test_hdate_month_names():
+    assert HDate(1, "חשוון", 5783) == HDate(1, "חשון", 5783) == HDate(1, 2, 5783)
+    assert HDate(1, "כסליו", 5783) == HDate(1, "כסלו", 5783) == HDate(1, 3, 5783)
+    assert HDate(1, "אדר א'", 5784) == HDate(1, "אדר א", 5784) == HDate(1, 6, 5784)
+    assert HDate(1, "אדר ב'", 5784) == HDate(1, "אדר ב", 5784) == HDate(1, 7, 5784)
+    assert HDate(1, "אדר", 5783) == HDate(1, 6, 5783)
+    assert HDate("א", "תשרי", "ה-תשפג") == HDate(1, 1, 5783)
+    with pytest.raises(ValueError):
+        HDate(1, "אדר", 5784)
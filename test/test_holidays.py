@@ -0,0 +1,41 @@
+from hdate.hdate import HDate
+from hdate.holidays import year_holidays, HOLIDAYS_TEMPLATES
+from hdate.molad import Months, YEARS_PATTERNS
+
+
+def test_templates():
+    assert {pattern for pattern, _ in HOLIDAYS_TEMPLATES} == YEARS_PATTERNS
+
+
+def test_year_holidays():
+    for year in range(5700, 5800):
+        for diaspora in (False, True):
+            for holiday in year_holidays(year, diaspora):
+                assert holiday.weekday == Months.weekday(holiday.date)
+                assert holiday.date == Months.date_add_days(
+                    HDate(1, 1, year), holiday.day_of_year - 1
+                )
+
+
+def test_holidays_weekdays():
+    """
+    Test the rules of לא אד"ו ראש and the postponed fasts
+    """
+    for year in range(5000, 6000):
+        for holiday in year_holidays(year):
+            if holiday.name == "יום כיפור":
+                assert holiday.weekday not in (1, 6)
+            if holiday.name in ("צום גדליה", "שבעה עשר בתמוז", "תשעה באב"):
+                assert holiday.weekday not in (6, 7)
+            if holiday.name == "תענית אסתר":
+                assert holiday.weekday != 7
+
+
+def test_diaspora():
+    israel = {holiday.name for holiday in year_holidays(5784)}
+    diaspora = year_holidays(5784, diaspora=True)
+    assert "שמחת תורה" not in israel
+    assert [h.date for h in diaspora if h.name == "שבועות"] == [
+        HDate(6, "סיון", 5784),
+        HDate(7, "סיון", 5784),
+    ]
@@ -0,0 +1,78 @@
+from hdate import instrumentation
+from hdate.hdate import HDate
+from hdate.instrumentation import instrument
+from hdate.molad import Months
+from hdate.sun import Sun
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def test_instrument():
+    originals = {
+        (cls, name): cls.__dict__[name] for cls, name in instrumentation.INSTRUMENTED
+    }
+    date = HDate(1, "אייר", 5784)
+    with instrument() as stats:
+        assert instrumentation.is_enabled()
+        for day in range(10):
+            Sun.location(date + day)
+        Months.year_begin_weekday(5784)
+        Months.year_info(98765)  # not cached yet
+    assert not instrumentation.is_enabled()
+    assert {
+        (cls, name): cls.__dict__[name] for cls, name in instrumentation.INSTRUMENTED
+    } == originals
+
+    functions = stats.function_stats()
+    assert functions["Sun.location"].calls == 10
+    assert functions["Sun.mean_location"].calls == 10
+    assert "Months.days_diff" not in functions
+    assert functions["Months._year_info"].calls >= 2
+    # the year and its next year, to find the year type
+    assert functions["Months._new_year_postpones"].calls >= 2
+    assert functions["Sun.location"].seconds >= functions["Sun.mean_location"].seconds
+    cache = stats.cache_stats()["Months.year_info"]
+    assert cache.hits + cache.misses > 0
+    assert "Sun.location" in stats.report()
+
+    Sun.location(date)
+    assert stats.calls("Sun.location") == 10
+
+
+def test_instrument_exception():
+    with pytest.raises(ValueError):
+        with instrument():
+            with pytest.raises(RuntimeError):
+                instrumentation.enable()
+            raise ValueError()
+    assert not instrumentation.is_enabled()
+
+
+def test_instrument_from_environment():
+    workload = (
+        "import datetime, hdate\n"
+        "from hdate.molad import Months, from_georgian\n"
+        "for day in range(0, 20000, 7):\n"
+        "    date = from_georgian(datetime.date(1900, 1, 1) + datetime.timedelta(day))\n"
+        "    Months.year_pattern(date._year)\n"
+    )
+    environment = dict(os.environ, HDATE_INSTRUMENT="1")
+    report = subprocess.run(
+        [sys.executable, "-c", workload],
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    calls = {
+        line.split()[0]: int(line.split()[1])
+        for line in report.splitlines()[1:]
+        if not line.startswith("cache ")
+    }
+    for name in ("Months._year_info", "Months._new_year_postpones"):
+        assert calls[name] > 0
+    assert "cache Months.year_info" in report
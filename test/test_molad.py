@@ -1,5 +1,9 @@
+import pytest
+
+from hdate import duration
 from hdate.hdate import HDate
-from hdate.molad import YEARS_PATTERNS, Months
+from hdate.molad import TKUFOT_METHODS, YEARS_PATTERNS, YEARS_PATTERNS_CODES, Months
+from hdate.leap_years import leapYear
 
 from collections import Counter
 
@@ -64,3 +68,213 @@ def test_months_in_years_o_1_():
             ) == Months._months_in_years_o_n_(  # pylint: disable=W0212
                 end, begin
             )
+
+
+def test_months_elapsed():
+    for year in range(1, 1000):
+        assert Months._months_elapsed(  # pylint: disable=W0212
+            year
+        ) == Months._months_in_years_o_n_(  # pylint: disable=W0212
+            year
+        )
+
+
+def test_elapsed_days():
+    """
+    Test closed form ראש השנה vs postpone rules on molad
+    """
+    for year in range(1, 6000, 7):
+        begin_weekday, postpones = Months.apply_postpone_rules(
+            Months.molad_day(year, 1),
+            leapYear.is_leap(year - 1),
+            leapYear.is_leap(year),
+        )
+        assert Months.year_begin_weekday(year) == (begin_weekday, postpones)
+        assert (Months.elapsed_days(year) + 1) % 7 + 1 == begin_weekday
+        assert Months.elapsed_days(year + 1) - Months.elapsed_days(
+            year
+        ) == Months.year_days(year)
+
+
+def test_absolute_day():
+    for year in range(5700, 5800, 3):
+        year_begin = HDate(1, 1, year)
+        for month in range(1, 13):
+            date = HDate(10, month, year)
+            assert Months.absolute_day(date) - Months.absolute_day(
+                year_begin
+            ) == Months.days_diff_o_n_(year_begin, date)
+
+
+def test_year_info_cache():
+    Months.year_info_cache_clear()
+    info = Months.year_info(5787)
+    assert Months.year_info("ה'תשפז") is info
+    assert Months.year_pattern(5787) == info.pattern
+    cache_info = Months.year_info_cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
+
+
+def test_year_table():
+    table = Months.year_table(0, 6000)
+    for index in range(0, 6000, 13):
+        info = Months.year_info(index)
+        assert table.year[index] == info.year
+        assert table.is_leap[index] == info.is_leap
+        assert table.weekday[index] == info.weekday
+        assert tuple(table.postpones[index]) == info.postpones
+        assert table.year_type[index] == info.year_type.value
+        assert YEARS_PATTERNS_CODES[table.pattern[index]] == info.pattern
+        assert table.days[index] == info.days
+        assert table.elapsed_days[index] == info.elapsed_days
+
+
+def test_diff_to_date():
+    """
+    Test the closed form inverse of absolute_day, including far future days
+    """
+    days = list(range(0, 2000)) + list(range(2_000_000, 2_100_000, 37))
+    days += list(range(10**9, 10**9 + 100_000, 97))
+    for day in days:
+        date = Months._diff_to_date(day)  # pylint: disable=W0212
+        assert 1 <= date._month_day <= Months.months_length(date._year)[date._month - 1]
+        assert Months.absolute_day(date) == day
+
+
+def test_iter_days():
+    begin, end = HDate(20, 11, 5780), HDate(5, 2, 5790)
+    days = 0
+    for date, weekday, day_of_year in Months.iter_days(begin, end):
+        assert date == Months.date_add_days(begin, days)
+        assert date._absolute_day == Months.absolute_day(date)
+        assert weekday == Months.weekday(date)
+        assert day_of_year == Months.days_diff(HDate(1, 1, date._year), date) + 1
+        days += 1
+    assert days == end - begin
+
+
+def test_possible_weekdays():
+    seen = {}
+    for date, weekday, _ in Months.iter_days(HDate(1, 1, 5000), HDate(1, 1, 5400)):
+        key = (date._is_leap, date._month, date._month_day)
+        seen.setdefault(key, set()).add(weekday)
+    for (is_leap, month, day), weekdays in seen.items():
+        assert Months.possible_weekdays(month, day, is_leap) == tuple(sorted(weekdays))
+    assert Months.possible_weekdays("תשרי", 1, True) == (2, 3, 5, 7)
+    assert Months.possible_weekdays("חשון", 30, False) == (1, 3, 5)
+
+
+
+@pytest.mark.parametrize("year", [5782, 5783, 5784])
+def test_weekday_out_of_year(year):
+    # HDate does not validate, days out of the year continue the weeks
+    last_month = len(Months.months_length(year))
+    last_day = Months.months_length(year)[-1]
+    first = HDate(1, 1, year)
+    last = HDate(last_day, last_month, year)
+    assert Months.weekday(HDate(0, 1, year)) == Months.weekday(first - 1)
+    after_last = HDate(last_day + 1, last_month, year)
+    assert Months.weekday(after_last) == Months.weekday(last + 1)
+    info = Months.year_info(year)
+    assert info.date_weekday(1, 0) == Months.weekday(first - 1)
+    assert info.date_weekday(last_month, last_day + 1) == Months.weekday(last + 1)
+
+def test_molad_table():
+    table = Months.molad_table(5700, 5800)
+    index = 0
+    for year in range(5700, 5800):
+        for month in range(1, len(Months.months_length(year)) + 1):
+            molad_day = Months.molad_day(year, month)
+            assert table.year[index] == year
+            assert table.month[index] == month
+            assert table.weekday[index] == molad_day.days
+            assert table.hours[index] == molad_day.hours
+            assert table.parts[index] == molad_day.parts
+            index += 1
+    assert index == len(table.year)
+    days = table.day.tolist()
+    assert all(29 <= after - before <= 30 for before, after in zip(days, days[1:]))
+
+
+def _tkufot_of_year(year, first_tkufa, sun_year, hours_only):
+    """
+    The tkufot of a single year, counted from the first molad of ניסן
+    """
+    nissan_tkufa = sun_year * (year - 1) + Months.molad(1, "ניסן") - first_tkufa
+    if hours_only:
+        nissan_tkufa = duration.duration(nissan_tkufa.days, nissan_tkufa.hours)
+    tkufa = nissan_tkufa - sun_year / 4 * 3
+    tkufot = []
+    for _ in range(4):
+        tkufa = tkufa + sun_year / 4
+        tkufot.append((HDate(1, 1, 1) + tkufa.days, tkufa.hours, tkufa.minutes))
+    return tkufot
+
+
+@pytest.mark.parametrize(
+    "method, year, tkufot",
+    [
+        # תקופת תשרי תשפ"ג : יום שישי, 7/10/2022 בשעה 15:00
+        (
+            "shmuel",
+            5783,
+            [((12, 1), 15, 0), ((13, 4), 22, 30), ((17, 7), 6, 0), ((19, 10), 13, 30)],
+        ),
+        (
+            "shmuel",
+            5000,
+            [((24, 1), 21, 0), ((28, 4), 4, 30), ((1, 8), 12, 0), ((3, 11), 19, 30)],
+        ),
+        (
+            "rav_ada",
+            5783,
+            [
+                ((1, 1), 6, 52.387),
+                ((2, 4), 14, 21.243),
+                ((5, 7), 21, 50.099),
+                ((8, 10), 5, 18.955),
+            ],
+        ),
+        (
+            "rav_ada",
+            5784,
+            [
+                ((11, 1), 12, 47.811),
+                ((14, 4), 20, 16.667),
+                ((17, 7), 3, 45.523),
+                ((20, 10), 11, 14.379),
+            ],
+        ),
+    ],
+)
+def test_tkufot_known(method, year, tkufot):
+    found = Months.tkufot_range(4990, 5790, method)[year - 4990]
+    assert found == (
+        Months.tkufot_shmuel(year)
+        if method == "shmuel"
+        else Months.tkufot_rav_ada(year)
+    )
+    for (date, hours, minutes), ((day, month), expected_hours, expected_minutes) in zip(
+        found, tkufot
+    ):
+        assert date == HDate(day, month, year)
+        assert hours == expected_hours
+        assert minutes == pytest.approx(expected_minutes, abs=1e-3)
+
+
+def test_tkufot_range():
+    for method, coefficients in TKUFOT_METHODS.items():
+        tkufot = Months.tkufot_range(5000, 5100, method)
+        for index, year in enumerate(range(5000, 5100, 9)):
+            expected = _tkufot_of_year(year, *coefficients)
+            for (date, hours, minutes), (
+                expected_date,
+                expected_hours,
+                expected_minutes,
+            ) in zip(tkufot[index * 9], expected):
+                assert date == expected_date
+                assert hours == expected_hours
+                assert minutes == pytest.approx(expected_minutes)
+    with pytest.raises(ValueError):
+        Months.tkufot_range(5000, 5100, "ptolemy")
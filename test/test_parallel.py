@@ -0,0 +1,30 @@
+import pytest
+
+from hdate.ecliptic_lat import EclipticLatitude
+from hdate.hdate import HDate
+from hdate.moon import Moon
+from hdate.parallel import map_days
+from hdate.sun import Sun
+from hdate.view_arc import ViewArc
+
+
+def test_map_days():
+    start = HDate(1, "אייר", 5784)
+    end = start + 23
+    for function in (
+        Sun.location,
+        Moon.true_location,
+        EclipticLatitude.compute,
+        ViewArc.compute,
+    ):
+        expected = [function(start + day) for day in range(end - start)]
+        assert map_days(function, start, end, workers=1) == expected
+        assert map_days(function, start, end, workers=2, chunk_size=5) == expected
+    assert map_days(Sun.location, end, start) == []
+
+
+@pytest.mark.parametrize("chunk_size", [0, -3])
+def test_map_days_invalid_chunk_size(chunk_size):
+    start = HDate(1, "אייר", 5784)
+    with pytest.raises(ValueError):
+        map_days(Sun.location, start, start + 10, workers=2, chunk_size=chunk_size)
@@ -0,0 +1,37 @@
+from hdate import molad
+from hdate.molad import Months, YEARS_PERIOD
+from hdate.period_table import build_period_table, use_period_table
+
+import pytest
+
+
+def test_years_period():
+    table = Months.year_table(1, 2000)
+    next_period = Months.year_table(1 + YEARS_PERIOD, 2000 + YEARS_PERIOD)
+    assert (table.pattern == next_period.pattern).all()
+    assert (table.days == next_period.days).all()
+
+
+def test_period_table(tmp_path):
+    path = str(tmp_path / "period.bin")
+    build_period_table(path)
+    years = list(range(1, 200)) + list(range(5000, 6000, 7)) + [10**7 + 3, 10**9]
+    expected = [
+        (Months.year_type(y), Months.year_pattern(y), Months.year_days(y))
+        for y in years
+    ]
+    use_period_table(path)
+    try:
+        assert [
+            (Months.year_type(y), Months.year_pattern(y), Months.year_days(y))
+            for y in years
+        ] == expected
+    finally:
+        molad.set_period_table(None)
+
+
+def test_period_table_corrupted(tmp_path):
+    path = tmp_path / "period.bin"
+    path.write_bytes(b"HDPT" + bytes(20))
+    with pytest.raises(ValueError):
+        use_period_table(str(path))
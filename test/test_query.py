@@ -0,0 +1,55 @@
+from hdate import molad
+from hdate.hdate import HDate
+from hdate.molad import Months, YearType
+from hdate.period_table import build_period_table, use_period_table
+from hdate.query import (
+    days_is,
+    find_years,
+    leap,
+    pattern_is,
+    weekday_is,
+    year_type_is,
+)
+
+import pytest
+
+PREDICATES = [
+    weekday_is("ניסן", 15, 1),
+    weekday_is("אדר א", 30, 2, 3),
+    leap() & year_type_is(YearType.FULL),
+    ~leap() | days_is(385),
+    pattern_is("בחג", "זשה"),
+    ~pattern_is(*molad.YEARS_PATTERNS),
+]
+
+
+def test_find_years():
+    for predicate in PREDICATES:
+        expected = [
+            year for year in range(4900, 5300) if predicate(Months.year_info(year))
+        ]
+        assert find_years(predicate, 4900, 5300) == expected
+        assert find_years(lambda info: predicate(info), 4900, 5300) == expected
+
+
+def test_passover_weekday():
+    for year in range(5700, 5800):
+        info = Months.year_info(year)
+        assert info.passover_weekday == Months.weekday(HDate(15, "ניסן", year))
+        assert info.date_weekday("אב", 9) == Months.weekday(HDate(9, "אב", year))
+
+
+def test_find_years_period_table(tmp_path):
+    path = str(tmp_path / "period.bin")
+    build_period_table(path)
+    expected = [find_years(predicate, 1, 3000) for predicate in PREDICATES]
+    use_period_table(path)
+    try:
+        assert [find_years(p, 1, 3000) for p in PREDICATES] == expected
+    finally:
+        molad.set_period_table(None)
+
+
+def test_pattern_is_invalid():
+    with pytest.raises(ValueError):
+        pattern_is("אבג")
@@ -0,0 +1,65 @@
+from hdate import molad
+from hdate import year_cache
+from hdate.molad import Months
+from hdate.year_cache import build_year_cache, load_year_cache, use_year_cache
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def test_year_cache(tmp_path):
+    path = str(tmp_path / "years.bin")
+    build_year_cache(path, 4000, 6000)
+    years = list(range(3990, 4010)) + list(range(5990, 6010))
+    expected_infos = [Months.year_info(year) for year in years]
+    expected_table = Months.year_table(4500, 4600)
+
+    use_year_cache(path)
+    Months.year_info_cache_clear()
+    try:
+        assert [Months.year_info(year) for year in years] == expected_infos
+        table = Months.year_table(4500, 4600)
+        for field in molad.YearTable._fields:
+            assert (getattr(table, field) == getattr(expected_table, field)).all()
+    finally:
+        molad.set_year_cache(None)
+        Months.year_info_cache_clear()
+
+
+def test_year_cache_stamp(tmp_path, monkeypatch):
+    path = str(tmp_path / "years.bin")
+    build_year_cache(path, 1, 100)
+    assert len(load_year_cache(path).year) == 99
+    monkeypatch.setattr(year_cache, "package_version", lambda: "0.0.0")
+    with pytest.raises(ValueError):
+        load_year_cache(path)
+
+
+def test_year_cache_truncated(tmp_path):
+    path = tmp_path / "years.bin"
+    build_year_cache(str(path), 1, 100)
+    path.write_bytes(path.read_bytes()[:-10])
+    with pytest.raises(ValueError):
+        load_year_cache(str(path))
+
+
+def test_year_cache_from_environment(tmp_path):
+    path = tmp_path / "years.bin"
+    script = (
+        "from hdate import molad\n"
+        "print(len(molad.year_cache.year), molad.Months.year_info(5787).pattern)\n"
+    )
+    environment = dict(os.environ, HDATE_YEAR_CACHE=str(path))
+    for _ in range(2):  # builds the file, then uses it
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            env=environment,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        assert output.split() == ["6999", Months.year_pattern(5787)]
+        assert path.exists()